@@ -1,12 +1,26 @@
 # agent.py
+import asyncio
+import base64
+import hashlib
+import io
 import os
-import json
-from collections import defaultdict, deque
+import re
+import time
+from collections import deque
 from datetime import datetime, timezone
 from typing import Any, Literal
 from uuid import uuid4
 
-import requests
+import httpx
+import orjson
+from cachetools import Cache, LRUCache
+from PIL import Image
+from tenacity import (
+    AsyncRetrying,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_exponential_jitter,
+)
 from uagents import Agent, Context, Protocol
 from uagents_core.storage import ExternalStorage
 
@@ -29,73 +43,247 @@ if not OPENAI_API_KEY:
 OPENAI_URL = os.getenv("OPENAI_CHAT_URL", "https://api.openai.com/v1/chat/completions")
 MODEL_ENGINE = os.getenv("MODEL_ENGINE", "gpt-5")
 MAX_TOKENS = int(os.getenv("MAX_TOKENS", "64"))
+# "action" summaries keep at most this many words
+ACTION_WORD_CAP = 8
+
+# Content-Type is left to each request: completion bodies are pre-serialized
+# with orjson and Batch API file uploads need multipart.
+HEADERS = {"Authorization": f"Bearer {OPENAI_API_KEY}"}
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Batch API: half-price, asynchronous completion for callers that can wait
+OPENAI_API_BASE = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
+BATCH_POLL_INTERVAL = float(os.getenv("BATCH_POLL_INTERVAL", "20"))
+
+
+# Shared async client: keeps HTTP/2 connections to the model API warm and lets
+# the agent's event loop keep serving other messages while a summary is pending.
+CLIENT = httpx.AsyncClient(
+    headers=HEADERS,
+    timeout=60,
+    limits=httpx.Limits(
+        max_keepalive_connections=20, max_connections=100, keepalive_expiry=30
+    ),
+    transport=httpx.AsyncHTTPTransport(http2=True, retries=2),
+)
+
+# -------- Rate limiting --------
+# Stay under the account's requests/tokens per minute instead of burning
+# attempts on 429s; rate-limited and 5xx replies are retried with backoff.
+MODEL_RPM = int(os.getenv("MODEL_RPM", "40"))
+MODEL_TPM = int(os.getenv("MODEL_TPM", "16000"))
+MAX_IN_FLIGHT = int(os.getenv("MAX_IN_FLIGHT", "8"))
+RETRY_ATTEMPTS = int(os.getenv("RETRY_ATTEMPTS", "4"))
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RateLimiter:
+    """Sliding one-minute window over request count and reported token usage."""
+
+    WINDOW = 60.0
+
+    def __init__(self, rpm: int, tpm: int) -> None:
+        self.rpm = rpm
+        self.tpm = tpm
+        self._requests: deque[float] = deque()
+        self._tokens: deque[tuple[float, int]] = deque()
+        self._token_total = 0
+        self._lock = asyncio.Lock()
+
+    def _expire(self, now: float) -> None:
+        while self._requests and now - self._requests[0] >= self.WINDOW:
+            self._requests.popleft()
+        while self._tokens and now - self._tokens[0][0] >= self.WINDOW:
+            self._token_total -= self._tokens.popleft()[1]
+
+    async def acquire(self) -> None:
+        """Wait until one more request fits in the current window."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._expire(now)
+                if len(self._requests) < self.rpm and self._token_total < self.tpm:
+                    self._requests.append(now)
+                    return
+                oldest = min(
+                    self._requests[0] if self._requests else now,
+                    self._tokens[0][0] if self._tokens else now,
+                )
+                await asyncio.sleep(max(0.05, self.WINDOW - (now - oldest)))
+
+    def record(self, tokens: int) -> None:
+        if tokens > 0:
+            self._tokens.append((time.monotonic(), tokens))
+            self._token_total += tokens
+
+
+RATE_LIMITER = RateLimiter(MODEL_RPM, MODEL_TPM)
+REQUEST_SLOTS = asyncio.Semaphore(MAX_IN_FLIGHT)
+_backoff = wait_exponential_jitter(initial=1, max=30)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRY_STATUSES
+    return isinstance(exc, httpx.TransportError)
+
+
+def _retry_wait(retry_state) -> float:
+    """Honour the server's Retry-After when given, else exponential jitter."""
+    exc = retry_state.outcome.exception()
+    if isinstance(exc, httpx.HTTPStatusError):
+        try:
+            return float(exc.response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            pass
+    return _backoff(retry_state)
 
-HEADERS = {
-    "Authorization": f"Bearer {OPENAI_API_KEY}",
-    "Content-Type": "application/json",
-}
 
 # Where Agentverse-hosted chat uploads are fetched
 STORAGE_URL = os.getenv("AGENTVERSE_URL", "https://agentverse.ai") + "/v1/storage"
+# Created on first download, once the agent identity is known
+STORAGE: ExternalStorage | None = None
+# resource_id -> {"mime_type", "raw"}; repeated references skip the download
+RESOURCE_CACHE: LRUCache[str, dict[str, Any]] = LRUCache(maxsize=256)
+# Images larger than this are thumbnailed to IMAGE_MAX_SIDE and re-encoded as
+# JPEG before upload, cutting both request size and vision-token cost.
+IMAGE_SHRINK_MIN_BYTES = int(os.getenv("IMAGE_SHRINK_MIN_BYTES", "100000"))
+IMAGE_MAX_SIDE = int(os.getenv("IMAGE_MAX_SIDE", "1024"))
 
 # -------- Memory: trajectory per sender --------
-# Keep the last N summaries to provide context for future messages
+# Keep the last N summaries to provide context for future messages; only the
+# SENDER_CAP most recently active senders are retained.
 TRAJECTORY_LEN = int(os.getenv("TRAJECTORY_LEN", "8"))
-trajectory = defaultdict(lambda: deque(maxlen=TRAJECTORY_LEN))
+SENDER_CAP = int(os.getenv("SENDER_CAP", "10000"))
+# When all cached summaries together exceed this many characters, the periodic
+# sweep drops the oldest quarter of every sender's trajectory.
+TOTAL_CHAR_BUDGET = int(os.getenv("TRAJECTORY_CHAR_BUDGET", "1000000"))
+TRAJECTORY_SWEEP_INTERVAL = float(os.getenv("TRAJECTORY_SWEEP_INTERVAL", "30"))
+
+
+class TrajectoryCache(LRUCache):
+    """LRU of per-sender summary deques that tracks total cached characters."""
+
+    def __init__(self, maxsize: int) -> None:
+        super().__init__(maxsize=maxsize)
+        self.total_chars = 0
+
+    def popitem(self):
+        sender, history = super().popitem()
+        self.total_chars -= sum(map(len, history))
+        return sender, history
+
+    def __missing__(self, sender: str) -> deque[str]:
+        # Called by Cache.__getitem__ on a miss: first message from this sender
+        history = self[sender] = deque(maxlen=TRAJECTORY_LEN)
+        return history
+
+    def for_sender(self, sender: str) -> deque[str]:
+        """Return (creating if needed) the sender's trajectory, marking it recent."""
+        return self[sender]
+
+    def remember(self, sender: str, summary: str) -> None:
+        history = self.for_sender(sender)
+        if len(history) == history.maxlen:
+            self.total_chars -= len(history[0])
+        history.append(summary)
+        self.total_chars += len(summary)
+
+    def reset(self, sender: str) -> None:
+        history = self.get(sender)
+        if history:
+            self.total_chars -= sum(map(len, history))
+            history.clear()
+
+    def trim(self) -> int:
+        """Drop the oldest quarter of each trajectory until under budget."""
+        dropped = 0
+        while self.total_chars > TOTAL_CHAR_BUDGET:
+            # Peek without promoting, so trimming leaves the LRU order intact
+            for sender in list(self):
+                history = Cache.__getitem__(self, sender)
+                for _ in range(max(1, len(history) // 4) if history else 0):
+                    self.total_chars -= len(history.popleft())
+                    dropped += 1
+        return dropped
+
+
+trajectory = TrajectoryCache(maxsize=SENDER_CAP)
+
+
+# -------- Micro-batching: coalesce bursts per sender --------
+# Messages arriving within BATCH_WINDOW seconds are summarized in one call.
+BATCH_WINDOW = float(os.getenv("BATCH_WINDOW", "0.25"))
+BATCH_MAX = int(os.getenv("BATCH_MAX", "8"))
+BATCH_MAX_IMAGES = int(os.getenv("BATCH_MAX_IMAGES", "4"))
+pending: dict[str, list[list[dict[str, Any]]]] = {}
+timers: dict[str, asyncio.TimerHandle] = {}
+# Context of each sender's newest message; a timed flush replies through it
+contexts: dict[str, Context] = {}
+# One flush per sender at a time, so replies and trajectory updates keep the
+# order the batches were taken in. Entries live only while a flush for that
+# sender is running or waiting; flush_users counts those flushes.
+flush_locks: dict[str, asyncio.Lock] = {}
+flush_users: dict[str, int] = {}
+# Timer-started flushes, held until done so they are not garbage-collected
+flush_tasks: set[asyncio.Future] = set()
+
+# -------- Summary cache: identical frames skip the model call --------
+# Keyed by a hash of the message content plus the sender's latest summary.
+SUMMARY_CACHE: LRUCache[str, str] = LRUCache(maxsize=4096)
+
+
+SummaryStyle = Literal["notification_text", "notification_voice", "action"]
+
+
+# Fixed per-style prompt settings, built once at import:
+# style -> (system_rules, char_limit, enforce_word_cap)
+STYLE_RULES: dict[str, tuple[str, int | None, bool]] = {
+    "notification_text": (
+        "You generate a SINGLE concise status line for a small screen.\n"
+        "- Max 50 characters.\n"
+        "- No emojis. Keep concrete and clear.\n"
+        "- Avoid filler words. No preamble.\n"
+        "- If unsure, respond with 'Thinking'.",
+        50,
+        False,
+    ),
+    "notification_voice": (
+        "You narrate a SINGLE natural-sounding voice update.\n"
+        "- Aim for <= 160 characters.\n"
+        "- Friendly but concise tone.\n"
+        "- No emojis.\n"
+        "- If unsure, respond with 'Thinking'.",
+        160,
+        False,
+    ),
+    "action": (
+        "You generate a SINGLE ultra-brief action summary.\n"
+        "- Max 8 words.\n"
+        "- No emojis. Keep concrete.\n"
+        "- Prefer verbs. No preamble.\n"
+        "- If unsure, respond with 'Thinking'.",
+        None,
+        True,
+    ),
+}
 
 
-def summarize_action(
-    content: list[dict[str, Any]],
-    history: list[str],
-    *,
-    summary_style: Literal["notification_text", "notification_voice"],
-) -> str:
-    """
-    Build a prompt for OpenAI GPT-5 that produces a concise summary.
+def _style_rules(summary_style: str) -> tuple[str, int | None, bool]:
+    """Return ``(system_rules, char_limit, enforce_word_cap)`` for a style."""
+    return STYLE_RULES.get(summary_style.lower(), STYLE_RULES["action"])
 
-    The behaviour depends on ``summary_style``:
-        - ``"notification_text"``: <=50 character UI-friendly blurb.
-        - ``"notification_voice"``: natural-sounding voice narration (~160 chars).
-    """
-    style = summary_style.lower()
-
-    if style == "notification_text":
-        system_rules = (
-            "You generate a SINGLE concise status line for a small screen.\n"
-            "- Max 50 characters.\n"
-            "- No emojis. Keep concrete and clear.\n"
-            "- Avoid filler words. No preamble.\n"
-            "- If unsure, respond with 'Thinking'."
-        )
-        char_limit = 50
-        enforce_word_cap = False
-    elif style == "notification_voice":
-        system_rules = (
-            "You narrate a SINGLE natural-sounding voice update.\n"
-            "- Aim for <= 160 characters.\n"
-            "- Friendly but concise tone.\n"
-            "- No emojis.\n"
-            "- If unsure, respond with 'Thinking'."
-        )
-        char_limit = 160
-        enforce_word_cap = False
-    else:
-        system_rules = (
-            "You generate a SINGLE ultra-brief action summary.\n"
-            "- Max 8 words.\n"
-            "- No emojis. Keep concrete.\n"
-            "- Prefer verbs. No preamble.\n"
-            "- If unsure, respond with 'Thinking'."
-        )
-        char_limit = None
-        enforce_word_cap = True
 
-    trajectory_text = ""
-    if history:
-        trajectory_text = "\n[Trajectory]\n" + "\n".join(
-            f"- {s}" for s in history[-TRAJECTORY_LEN:]
-        )
+def _trajectory_text(history: list[str]) -> str:
+    if not history:
+        return ""
+    return "\n[Trajectory]\n" + "\n".join(f"- {s}" for s in history[-TRAJECTORY_LEN:])
 
+
+def _build_user_parts(
+    content: list[dict[str, Any]], *, max_images: int | None = None
+) -> list[dict[str, Any]]:
+    """Translate chat content into OpenAI user message parts."""
     user_parts: list[dict[str, Any]] = []
 
     # Current thoughts + optional image(s)
@@ -105,7 +293,15 @@ def summarize_action(
         elif item.get("type") == "resource":
             mime_type = item.get("mime_type", "")
             if mime_type.startswith("image/"):
-                data_url = f"data:{mime_type};base64,{item['contents']}"
+                if max_images is not None and max_images <= 0:
+                    user_parts.append({"type": "text", "text": "[Note] Image omitted"})
+                    continue
+                if max_images is not None:
+                    max_images -= 1
+                # Images travel as raw bytes and are base64-encoded only here,
+                # right before the request body is serialized.
+                encoded = base64.b64encode(item["raw"]).decode("ascii")
+                data_url = f"data:{mime_type};base64,{encoded}"
                 user_parts.append(
                     {
                         "type": "image_url",
@@ -119,45 +315,121 @@ def summarize_action(
                         "text": f"[Note] Unsupported mime type: {mime_type}",
                     }
                 )
-
-    data = {
+    return user_parts
+
+
+def _request_body(
+    system_prompt: str,
+    user_parts: list[dict[str, Any]],
+    cache_key: str | None = None,
+    max_tokens: int = MAX_TOKENS,
+) -> dict:
+    # prompt_cache_key routes one sender's calls to the same OpenAI prompt
+    # cache. Only the style rules at the start of the system prompt are stable:
+    # the trajectory after them is a sliding window that changes every call
+    # once full, and the rules alone are under the 1024-token cache minimum.
+    body = {
         "model": MODEL_ENGINE,
-        "max_tokens": MAX_TOKENS,
+        "max_tokens": max_tokens,
         "messages": [
-            {"role": "system", "content": system_rules + trajectory_text},
+            {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_parts or [{"type": "text", "text": ""}]},
         ],
     }
+    if cache_key:
+        body["prompt_cache_key"] = cache_key
+    return body
 
-    try:
-        resp = requests.post(
-            OPENAI_URL, headers=HEADERS, data=json.dumps(data), timeout=60
-        )
-        resp.raise_for_status()
-    except requests.exceptions.RequestException:
-        return "Thinking"
 
-    payload = resp.json()
+def _reply_text(payload: dict) -> str:
+    """Extract the stripped reply text from a chat completion ("" if absent)."""
     choices = payload.get("choices", [])
     if not choices:
-        return "Thinking"
+        return ""
 
     message = choices[0].get("message", {})
     content = message.get("content", "")
     if isinstance(content, list):
-        text = "".join(
-            part.get("text", "")
-            for part in content
-            if isinstance(part, dict) and part.get("type") == "text"
-        ).strip()
-    else:
-        text = str(content).strip()
+        # The short replies arrive in a single text part; stop at the first one
+        for part in content:
+            if isinstance(part, dict) and part.get("type") == "text":
+                return str(part.get("text", "")).strip()
+        return ""
+    return str(content).strip()
+
+
+async def _stream_reply(body: bytes, word_limit: int) -> str:
+    """Read a streamed completion, hanging up once ``word_limit`` words are in."""
+    text = ""
+    async with CLIENT.stream(
+        "POST", OPENAI_URL, headers=JSON_HEADERS, content=body
+    ) as resp:
+        resp.raise_for_status()
+        async for line in resp.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = line[len("data: ") :]
+            if data == "[DONE]":
+                break
+            event = orjson.loads(data)
+            RATE_LIMITER.record((event.get("usage") or {}).get("total_tokens", 0))
+            for choice in event.get("choices", []):
+                text += (choice.get("delta") or {}).get("content") or ""
+            # A word past the cap means the last kept word is complete; leaving
+            # the block closes the connection instead of waiting for the rest.
+            if len(text.split()) > word_limit:
+                break
+    return text.strip()
+
+
+async def _complete(
+    system_prompt: str,
+    user_parts: list[dict[str, Any]],
+    cache_key: str | None = None,
+    *,
+    word_limit: int | None = None,
+    max_tokens: int = MAX_TOKENS,
+) -> str:
+    """Run a chat completion and return the stripped reply text ("" on failure).
 
+    With ``word_limit`` the reply is streamed and dropped early once that many
+    words have arrived, since the rest would be trimmed anyway.
+    """
+    request = _request_body(system_prompt, user_parts, cache_key, max_tokens)
+    if word_limit:
+        request["stream"] = True
+        request["stream_options"] = {"include_usage": True}
+    body = orjson.dumps(request)
+    try:
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception(_is_retryable),
+            wait=_retry_wait,
+            stop=stop_after_attempt(RETRY_ATTEMPTS),
+            reraise=True,
+        ):
+            with attempt:
+                async with REQUEST_SLOTS:
+                    await RATE_LIMITER.acquire()
+                    if word_limit:
+                        return await _stream_reply(body, word_limit)
+                    resp = await CLIENT.post(
+                        OPENAI_URL, headers=JSON_HEADERS, content=body
+                    )
+                resp.raise_for_status()
+        payload = orjson.loads(resp.content)
+    except (httpx.HTTPError, orjson.JSONDecodeError):
+        return ""
+
+    RATE_LIMITER.record(payload.get("usage", {}).get("total_tokens", 0))
+    return _reply_text(payload)
+
+
+def _trim_summary(text: str, char_limit: int | None, enforce_word_cap: bool) -> str:
     # Enforce the 8-word cap defensively
     if enforce_word_cap:
         words = text.split()
-        if len(words) > 8:
-            text = " ".join(words[:8])
+        if len(words) > ACTION_WORD_CAP:
+            text = " ".join(words[:ACTION_WORD_CAP])
 
     if char_limit and len(text) > char_limit:
         text = text[:char_limit].rstrip()
@@ -169,6 +441,216 @@ def summarize_action(
     return text
 
 
+async def summarize_action(
+    content: list[dict[str, Any]],
+    history: list[str],
+    *,
+    summary_style: SummaryStyle = "action",
+    cache_key: str | None = None,
+) -> str:
+    """
+    Build a prompt for OpenAI GPT-5 that produces a concise summary.
+
+    The behaviour depends on ``summary_style``:
+        - ``"notification_text"``: <=50 character UI-friendly blurb.
+        - ``"notification_voice"``: natural-sounding voice narration (~160 chars).
+        - ``"action"``: ultra-brief summary of at most 8 words.
+
+    ``cache_key`` (typically the sender) is sent as ``prompt_cache_key`` so
+    that sender's calls share one OpenAI prompt cache.
+    """
+    system_rules, char_limit, enforce_word_cap = _style_rules(summary_style)
+    text = await _complete(
+        system_rules + _trajectory_text(history),
+        _build_user_parts(content),
+        cache_key,
+        word_limit=ACTION_WORD_CAP if enforce_word_cap else None,
+    )
+    return _trim_summary(text, char_limit, enforce_word_cap)
+
+
+_NUMBERED_LINE = re.compile(r"^\s*\[?(\d+)[\].):]\s*(.*)$")
+
+
+def _numbered_summaries(
+    text: str, count: int, char_limit: int | None, enforce_word_cap: bool
+) -> list[str]:
+    """Map a reply of ``'<n>. <summary>'`` lines back to ``count`` summaries."""
+    summaries: dict[int, str] = {}
+    for line in text.splitlines():
+        match = _NUMBERED_LINE.match(line)
+        if match:
+            summaries.setdefault(int(match.group(1)), match.group(2).strip())
+
+    return [
+        _trim_summary(summaries.get(index, ""), char_limit, enforce_word_cap)
+        for index in range(1, count + 1)
+    ]
+
+
+async def summarize_action_group(
+    contents: list[list[dict[str, Any]]],
+    history: list[str],
+    *,
+    summary_style: SummaryStyle = "action",
+    cache_key: str | None = None,
+) -> list[str]:
+    """
+    Summarize several messages from one sender with a single model call.
+
+    Each entry of ``contents`` is answered on its own numbered line; entries
+    the model skips fall back to ``"Thinking"``.
+    """
+    if len(contents) == 1:
+        return [
+            await summarize_action(
+                contents[0],
+                history,
+                summary_style=summary_style,
+                cache_key=cache_key,
+            )
+        ]
+
+    system_rules, char_limit, enforce_word_cap = _style_rules(summary_style)
+    user_parts: list[dict[str, Any]] = [
+        {
+            "type": "text",
+            "text": f"You receive {len(contents)} numbered updates. Reply with "
+            f"exactly {len(contents)} lines formatted '<n>. <summary>', one per "
+            "update.",
+        }
+    ]
+    images_left = BATCH_MAX_IMAGES
+    for index, content in enumerate(contents, start=1):
+        user_parts.append({"type": "text", "text": f"[{index}]"})
+        parts = _build_user_parts(content, max_images=images_left)
+        images_left -= sum(1 for part in parts if part["type"] == "image_url")
+        user_parts.extend(parts)
+
+    text = await _complete(
+        system_rules + _trajectory_text(history),
+        user_parts,
+        cache_key,
+        max_tokens=MAX_TOKENS * len(contents),
+    )
+    return _numbered_summaries(text, len(contents), char_limit, enforce_word_cap)
+
+
+async def summarize_actions_bulk(
+    items: list[tuple[list[dict[str, Any]], list[str]]],
+    *,
+    summary_style: SummaryStyle = "action",
+) -> list[str]:
+    """
+    Summarize independent ``(content, history)`` pairs with a single model call.
+
+    Unlike :func:`summarize_action_group`, every item carries its own
+    trajectory, so unrelated prompts (e.g. steps from a recorded trace) can
+    share one request when throughput is bound by requests per minute.
+    Entries the model skips fall back to ``"Thinking"``.
+    """
+    system_rules, char_limit, enforce_word_cap = _style_rules(summary_style)
+    user_parts: list[dict[str, Any]] = [
+        {
+            "type": "text",
+            "text": f"You receive {len(items)} independent sections separated by "
+            f"'###'. Reply with exactly {len(items)} lines formatted "
+            "'<n>. <summary>', one per section, each judged only on its own "
+            "trajectory and content.",
+        }
+    ]
+    for index, (content, history) in enumerate(items, start=1):
+        user_parts.append(
+            {"type": "text", "text": f"### [{index}]{_trajectory_text(history)}"}
+        )
+        user_parts.extend(_build_user_parts(content))
+
+    text = await _complete(
+        system_rules, user_parts, max_tokens=MAX_TOKENS * max(1, len(items))
+    )
+    return _numbered_summaries(text, len(items), char_limit, enforce_word_cap)
+
+
+async def summarize_action_batch(
+    contents: list[list[dict[str, Any]]],
+    histories: list[list[str]],
+    *,
+    summary_style: SummaryStyle = "action",
+) -> list[str]:
+    """
+    Summarize many independent prompts through the OpenAI Batch API.
+
+    Results arrive within the batch completion window rather than in real
+    time, at roughly half the per-token price. ``contents[i]`` is paired with
+    ``histories[i]``; failed or missing entries fall back to ``"Thinking"``.
+    """
+    system_rules, char_limit, enforce_word_cap = _style_rules(summary_style)
+    lines = [
+        orjson.dumps(
+            {
+                "custom_id": f"t{index}",
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": _request_body(
+                    system_rules + _trajectory_text(history),
+                    _build_user_parts(content),
+                ),
+            }
+        )
+        for index, (content, history) in enumerate(zip(contents, histories))
+    ]
+
+    texts: dict[str, str] = {}
+    try:
+        upload = await CLIENT.post(
+            f"{OPENAI_API_BASE}/files",
+            data={"purpose": "batch"},
+            files={"file": ("summaries.jsonl", b"\n".join(lines))},
+        )
+        upload.raise_for_status()
+        created = await CLIENT.post(
+            f"{OPENAI_API_BASE}/batches",
+            json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+        )
+        created.raise_for_status()
+        batch = created.json()
+
+        while batch.get("status") not in {
+            "completed",
+            "failed",
+            "expired",
+            "cancelled",
+        }:
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+            polled = await CLIENT.get(f"{OPENAI_API_BASE}/batches/{batch['id']}")
+            polled.raise_for_status()
+            batch = polled.json()
+
+        if batch.get("output_file_id"):
+            results = await CLIENT.get(
+                f"{OPENAI_API_BASE}/files/{batch['output_file_id']}/content"
+            )
+            results.raise_for_status()
+            for line in results.content.splitlines():
+                if not line.strip():
+                    continue
+                result = orjson.loads(line)
+                response = result.get("response") or {}
+                if response.get("status_code") == 200:
+                    texts[result["custom_id"]] = _reply_text(response.get("body", {}))
+    except (httpx.HTTPError, KeyError, ValueError):
+        pass
+
+    return [
+        _trim_summary(texts.get(f"t{index}", ""), char_limit, enforce_word_cap)
+        for index in range(len(contents))
+    ]
+
+
 # -------- Agent & Protocol --------
 agent = Agent()
 chat_proto = Protocol(spec=chat_protocol_spec)
@@ -190,6 +672,48 @@ def create_metadata(metadata: dict[str, str]) -> ChatMessage:
     )
 
 
+def shrink_image(mime_type: str, raw: bytes) -> tuple[str, bytes]:
+    """Downscale an image to a JPEG no larger than IMAGE_MAX_SIDE."""
+    if len(raw) < IMAGE_SHRINK_MIN_BYTES:
+        return mime_type, raw
+
+    try:
+        image = Image.open(io.BytesIO(raw))
+        image.thumbnail((IMAGE_MAX_SIDE, IMAGE_MAX_SIDE))
+        buffer = io.BytesIO()
+        image.convert("RGB").save(buffer, "JPEG", quality=85, optimize=True)
+    except (OSError, Image.DecompressionBombError):
+        # Formats Pillow can't decode (SVG, HEIC without a plugin, truncated
+        # files) go to the model untouched, as before shrinking existed
+        return mime_type, raw
+    return "image/jpeg", buffer.getvalue()
+
+
+def fetch_resource(resource_id: str) -> dict[str, Any]:
+    """Download an upload and decode it to raw bytes (blocking)."""
+    data = STORAGE.download(resource_id)
+    mime_type = data["mime_type"]
+    raw = base64.b64decode(data["contents"])
+    if mime_type.startswith("image/"):
+        mime_type, raw = shrink_image(mime_type, raw)
+    return {"mime_type": mime_type, "raw": raw}
+
+
+async def download_resource(ctx: Context, resource_id: str) -> dict[str, Any]:
+    """Fetch an Agentverse upload off the event loop, reusing cached copies."""
+    global STORAGE
+
+    cached = RESOURCE_CACHE.get(resource_id)
+    if cached is not None:
+        return cached
+
+    if STORAGE is None:
+        STORAGE = ExternalStorage(identity=ctx.agent.identity, storage_url=STORAGE_URL)
+    data = await asyncio.to_thread(fetch_resource, resource_id)
+    RESOURCE_CACHE[resource_id] = data
+    return data
+
+
 @chat_proto.on_message(ChatMessage)
 async def on_chat(ctx: Context, sender: str, msg: ChatMessage):
     ctx.logger.debug(f"[chat] from={sender} id={msg.msg_id}")
@@ -211,7 +735,7 @@ async def on_chat(ctx: Context, sender: str, msg: ChatMessage):
             await ctx.send(sender, create_metadata({"attachments": "true"}))
 
             # Optional: reset trajectory on new session
-            trajectory[sender].clear()
+            trajectory.reset(sender)
 
         elif isinstance(item, TextContent):
             # Treat any incoming text as the agent's "current mental thoughts"
@@ -220,15 +744,12 @@ async def on_chat(ctx: Context, sender: str, msg: ChatMessage):
         elif isinstance(item, ResourceContent):
             # Download the uploaded resource (e.g., image) from Agentverse storage
             try:
-                storage = ExternalStorage(
-                    identity=ctx.agent.identity, storage_url=STORAGE_URL
-                )
-                data = storage.download(str(item.resource_id))
+                data = await download_resource(ctx, str(item.resource_id))
                 prompt_content.append(
                     {
                         "type": "resource",
                         "mime_type": data["mime_type"],
-                        "contents": data["contents"],  # base64
+                        "raw": data["raw"],
                     }
                 )
             except Exception as ex:
@@ -240,15 +761,106 @@ async def on_chat(ctx: Context, sender: str, msg: ChatMessage):
         await ctx.send(sender, create_text_chat("Action unclear"))
         return
 
-    # Summarize using trajectory for context
-    history = list(trajectory[sender])
-    summary = summarize_action(prompt_content, history)
+    contexts[sender] = ctx
+    batch = pending.setdefault(sender, [])
+    batch.append(prompt_content)
+    if len(batch) >= BATCH_MAX:
+        await flush(ctx, sender)
+    elif sender not in timers:
+        loop = asyncio.get_running_loop()
+        timers[sender] = loop.call_later(BATCH_WINDOW, start_timed_flush, sender)
+
+
+def start_timed_flush(sender: str) -> None:
+    """Timer callback: flush ``sender`` in a tracked task."""
+    ctx = contexts.get(sender)
+    if ctx is None:
+        return
+    task = asyncio.ensure_future(flush(ctx, sender))
+    flush_tasks.add(task)
+
+    def finished(task: asyncio.Future) -> None:
+        flush_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            ctx.logger.error(f"[batch] flush for {sender} failed: {task.exception()!r}")
+
+    task.add_done_callback(finished)
+
+
+def content_key(content: list[dict[str, Any]], history: list[str]) -> str:
+    """Hash message content together with the trajectory tail."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update((history[-1] if history else "").encode("utf-8"))
+    for item in content:
+        digest.update(b"\0")
+        if item.get("type") == "text":
+            digest.update(item["text"].encode("utf-8"))
+        elif item.get("type") == "resource":
+            digest.update(item.get("mime_type", "").encode("ascii"))
+            digest.update(item["raw"])
+    return digest.hexdigest()
+
+
+async def flush(ctx: Context, sender: str) -> None:
+    """Take everything buffered for ``sender`` and reply to it in order."""
+    timer = timers.pop(sender, None)
+    if timer is not None:
+        timer.cancel()
+    batch = pending.pop(sender, None)
+    ctx = contexts.pop(sender, ctx)
+    if not batch:
+        return
+
+    lock = flush_locks.setdefault(sender, asyncio.Lock())
+    flush_users[sender] = flush_users.get(sender, 0) + 1
+    try:
+        async with lock:
+            await summarize_and_reply(ctx, sender, batch)
+    finally:
+        flush_users[sender] -= 1
+        if not flush_users[sender]:
+            del flush_users[sender]
+            del flush_locks[sender]
+
+
+async def summarize_and_reply(
+    ctx: Context, sender: str, batch: list[list[dict[str, Any]]]
+) -> None:
+    """Summarize one batch and send one reply per message."""
+    # Summarize using trajectory for context, answering repeats from the cache
+    if sender not in trajectory:
+        ctx.logger.debug(f"[memory] new trajectory for {sender}")
+    history = list(trajectory.for_sender(sender))
+    keys = [content_key(content, history) for content in batch]
+    summaries = [SUMMARY_CACHE.get(key) for key in keys]
+    misses = [index for index, summary in enumerate(summaries) if summary is None]
+    if misses:
+        fresh = await summarize_action_group(
+            [batch[index] for index in misses], history, cache_key=sender
+        )
+        for index, summary in zip(misses, fresh):
+            summaries[index] = summary
+            if summary != "Thinking":
+                SUMMARY_CACHE[keys[index]] = summary
+
+    for summary in summaries:
+        # Update trajectory memory
+        trajectory.remember(sender, summary)
+
+        # Return the short, single-line summary
+        await ctx.send(sender, create_text_chat(summary))
+
+
+@agent.on_interval(period=TRAJECTORY_SWEEP_INTERVAL)
+async def sweep_trajectories(ctx: Context):
+    if trajectory.total_chars > TOTAL_CHAR_BUDGET:
+        dropped = trajectory.trim()
+        ctx.logger.info(f"[memory] dropped {dropped} old trajectory summaries")
 
-    # Update trajectory memory
-    trajectory[sender].append(summary)
 
-    # Return the short, single-line summary
-    await ctx.send(sender, create_text_chat(summary))
+@agent.on_event("shutdown")
+async def close_client(ctx: Context):
+    await CLIENT.aclose()
 
 
 @chat_proto.on_message(ChatAcknowledgement)
@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional, Tuple
 import pytesseract
 import requests
 from PIL import Image
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pytesseract import Output
 
 from src.s3.memory.procedural_memory import PROCEDURAL_MEMORY
@@ -17,6 +19,20 @@ import logging
 
 logger = logging.getLogger("desktopenv.agent")
 
+# Backend (backend/main.py) endpoint notified when a FaceTime call starts.
+CALL_STARTED_URL = "http://127.0.0.1:8003/api/call_started"
+
+# Pooled keep-alive session so repeated call notifications reuse a connection.
+_backend_session = requests.Session()
+_backend_session.mount(
+    "http://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    ),
+)
+
 
 class ACI:
     def __init__(self):
@@ -32,6 +48,7 @@ def agent_action(func):
 UBUNTU_APP_SETUP = f"""import subprocess;
 import difflib;
 import pyautogui;
+import time;
 pyautogui.press('escape');
 time.sleep(0.5);
 output = subprocess.check_output(['wmctrl', '-lx']);
@@ -418,16 +435,10 @@ class OSWorldACI(ACI):
         uri = f"facetime://{number.strip()}"
 
         # Notify the server that a call has started
-        server_host = "127.0.0.1"
-        if server_host == "0.0.0.0":
-            server_host = "127.0.0.1"
-        server_port = "8003"
         payload = {"number": str(number).strip()}
         try:
-            requests.post(
-                f"http://{server_host}:{server_port}/api/call_started",
-                json=payload,
-                timeout=2,
+            _backend_session.post(
+                CALL_STARTED_URL, json=payload, timeout=2
             ).raise_for_status()
             # logger.info("Notified /api/call_started")
         except requests.RequestException as exc:
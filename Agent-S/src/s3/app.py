@@ -397,8 +397,16 @@ def _wait_if_paused() -> bool:
 
 
 def run_agent(
-    agent: AgentS3, instruction: str, scaled_width: int, scaled_height: int
+    agent: AgentS3,
+    instruction: str,
+    scaled_width: int,
+    scaled_height: int,
+    conversation: Optional[str] = None,
 ) -> None:
+    completion: dict[str, object] = {}
+    if conversation:
+        # Lets the backend notify whoever asked for this run
+        completion["conversation"] = conversation
     obs = {}
     for step in range(15):
         if STATE.stop_event.is_set():
@@ -444,7 +452,7 @@ def run_agent(
                 # )
                 requests.post(
                     f"http://{SERVER_HOST}:{SERVER_PORT}/api/completetask",
-                    json={"status": status, "action": action_text},
+                    json={"status": status, "action": action_text, **completion},
                     timeout=2,
                 )
             except requests.RequestException:
@@ -501,7 +509,17 @@ def _extract_prompt(req: Request) -> str:
     return raw_body.strip()
 
 
-def _agent_worker(prompt: str) -> None:
+def _extract_conversation(req: Request) -> Optional[str]:
+    """Return the backend's requester key for this prompt, if it sent one."""
+    payload = req.get_json(silent=True)
+    if isinstance(payload, dict):
+        conversation = payload.get("conversation")
+        if isinstance(conversation, str) and conversation:
+            return conversation
+    return None
+
+
+def _agent_worker(prompt: str, conversation: Optional[str] = None) -> None:
     LOGGER.debug("Agent worker started with prompt: %s", prompt)
     was_stopped = False
     try:
@@ -511,7 +529,7 @@ def _agent_worker(prompt: str) -> None:
 
         AGENT.reset()
         scaled_width, scaled_height = SCALED_DIMENSIONS
-        run_agent(AGENT, prompt, scaled_width, scaled_height)
+        run_agent(AGENT, prompt, scaled_width, scaled_height, conversation)
     except Exception:
         LOGGER.exception("Agent run failed.")
     finally:
@@ -555,7 +573,7 @@ def stop_agent(wait: bool = True) -> None:
         STATE.pause_event.set()
 
 
-def start_agent(prompt: str) -> None:
+def start_agent(prompt: str, conversation: Optional[str] = None) -> None:
     stop_agent(wait=True)
 
     if not prompt:
@@ -565,7 +583,9 @@ def start_agent(prompt: str) -> None:
             STATE.prompt = None
         return
 
-    worker = threading.Thread(target=_agent_worker, args=(prompt,), daemon=True)
+    worker = threading.Thread(
+        target=_agent_worker, args=(prompt, conversation), daemon=True
+    )
     with STATE_LOCK:
         STATE.prompt = prompt
         STATE.running = True
@@ -608,7 +628,7 @@ def start_chat():
     if not prompt:
         return jsonify({"error": "Prompt is required."}), 400
 
-    start_agent(prompt)
+    start_agent(prompt, _extract_conversation(request))
     return jsonify({"status": "started", "state": STATE.to_dict()}), 200
 
 
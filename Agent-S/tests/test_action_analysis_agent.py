@@ -4,17 +4,27 @@ Standalone harness for summarize_action that prints the model output.
 
 The prompt encourages the desktop agent to leverage Codex after noticing the
 Codex logo in image.png. Requires OPENAI_API_KEY to be set.
+
+With ``--batch``, one prompt per stdin line is paired with image.png and
+submitted through the (slower, cheaper) Batch API instead. ``--image`` may be
+repeated to attach several screenshots in place of image.png. With
+``--prompts-file``, every prompt in the file (one per line) is summarized in a
+single bulk request.
 """
 
 from __future__ import annotations
 
-import base64
+import argparse
+import asyncio
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from importlib import reload
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
 
 def load_module() -> Any:
@@ -26,30 +36,129 @@ def load_module() -> Any:
     return reload(module)
 
 
-def encode_image(path: Path) -> Dict[str, str]:
-    data = base64.b64encode(path.read_bytes()).decode("utf-8")
-    return {"type": "resource", "mime_type": "image/png", "contents": data}
+@lru_cache(maxsize=128)
+def _encode_cached(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    # mtime_ns/size are part of the cache key so edited files are re-read.
+    return MappingProxyType(
+        {"type": "resource", "mime_type": "image/png", "raw": Path(path).read_bytes()}
+    )
+
+
+def encode_image(path: Path) -> Mapping[str, Any]:
+    stat = path.stat()
+    return _encode_cached(str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
 
+# Below this size a file is read inline; a worker thread costs more than it saves.
+PARALLEL_MIN_BYTES = 64 * 1024
 
-def build_payload(prompt: str, history: List[str], image_path: Path) -> Dict[str, Any]:
+
+def encode_images(paths: List[Path]) -> List[Mapping[str, Any]]:
+    if len(paths) > 1 and any(p.stat().st_size >= PARALLEL_MIN_BYTES for p in paths):
+        with ThreadPoolExecutor(
+            max_workers=min(len(paths), os.cpu_count() or 1)
+        ) as pool:
+            return list(pool.map(encode_image, paths))
+    return [encode_image(path) for path in paths]
+
+
+def build_payload(
+    prompt: str, history: List[str], image_paths: List[Path]
+) -> Dict[str, Any]:
     content: List[Dict[str, Any]] = [
         {"type": "text", "text": prompt},
-        encode_image(image_path),
+        *encode_images(image_paths),
     ]
     return {"content": content, "history": history}
 
 
+def run_batch(module: Any, image_paths: List[Path]) -> int:
+    prompts = [line.strip() for line in sys.stdin if line.strip()]
+    if not prompts:
+        print("No prompts read from stdin.", file=sys.stderr)
+        return 1
+
+    contents = [build_payload(prompt, [], image_paths)["content"] for prompt in prompts]
+    try:
+        summaries = asyncio.run(
+            module.summarize_action_batch(contents, [[] for _ in prompts])
+        )
+    except Exception as exc:
+        print(f"[error] summarize_action_batch failed: {exc}", file=sys.stderr)
+        return 1
+
+    output = [
+        {"prompt": prompt, "summary": summary}
+        for prompt, summary in zip(prompts, summaries)
+    ]
+    print(json.dumps(output, indent=2))
+    return 0
+
+
+def run_bulk(module: Any, prompts_file: Path, image_paths: List[Path]) -> int:
+    prompts = [
+        line.strip()
+        for line in prompts_file.read_text(encoding="utf-8").splitlines()
+        if line.strip()
+    ]
+    if not prompts:
+        print(f"No prompts found in {prompts_file}.", file=sys.stderr)
+        return 1
+
+    items = [
+        (build_payload(prompt, [], image_paths)["content"], []) for prompt in prompts
+    ]
+    try:
+        summaries = asyncio.run(module.summarize_actions_bulk(items))
+    except Exception as exc:
+        print(f"[error] summarize_actions_bulk failed: {exc}", file=sys.stderr)
+        return 1
+
+    output = [
+        {"prompt": prompt, "summary": summary}
+        for prompt, summary in zip(prompts, summaries)
+    ]
+    print(json.dumps(output, indent=2))
+    return 0
+
+
 def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Read prompts from stdin and summarize them via the Batch API.",
+    )
+    parser.add_argument(
+        "--image",
+        action="append",
+        type=Path,
+        dest="images",
+        help="Screenshot to attach (repeatable; defaults to image.png).",
+    )
+    parser.add_argument(
+        "--prompts-file",
+        type=Path,
+        help="Summarize every prompt in this file (one per line) in one request.",
+    )
+    args = parser.parse_args()
+
     if not os.getenv("OPENAI_API_KEY"):
         print("Set OPENAI_API_KEY before running.", file=sys.stderr)
         return 1
 
-    image_path = Path("image.png")
-    if not image_path.exists():
-        print(f"Missing image asset: {image_path}", file=sys.stderr)
-        return 1
+    image_paths = args.images or [Path("image.png")]
+    for image_path in image_paths:
+        if not image_path.exists():
+            print(f"Missing image asset: {image_path}", file=sys.stderr)
+            return 1
 
     module = load_module()
+    if args.batch:
+        return run_batch(module, image_paths)
+    if args.prompts_file:
+        return run_bulk(module, args.prompts_file, image_paths)
+
     payload = build_payload(
         prompt=(
             "The desktop shows the Codex logo. Guide the computer-use agent "
@@ -59,11 +168,13 @@ def main() -> int:
             "Observed developer tooling shortcuts",
             "Captured IDE preparation steps for Codex",
         ],
-        image_path=image_path,
+        image_paths=image_paths,
     )
 
     try:
-        summary = module.summarize_action(payload["content"], payload["history"])
+        summary = asyncio.run(
+            module.summarize_action(payload["content"], payload["history"])
+        )
     except Exception as exc:
         print(f"[error] summarize_action failed: {exc}", file=sys.stderr)
         return 1
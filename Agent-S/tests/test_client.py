@@ -15,6 +15,9 @@ from typing import Callable, Dict
 
 import requests
 
+# Shared so successive commands reuse one keep-alive connection
+_SESSION = requests.Session()
+
 
 def _print_json(title: str, payload: Dict) -> None:
     """Render JSON payloads in a readable format."""
@@ -23,7 +26,7 @@ def _print_json(title: str, payload: Dict) -> None:
 
 
 def send_prompt(base_url: str, prompt: str) -> None:
-    response = requests.post(
+    response = _SESSION.post(
         f"{base_url}/api/chat",
         json={"prompt": prompt},
         timeout=30,
@@ -32,7 +35,7 @@ def send_prompt(base_url: str, prompt: str) -> None:
 
 
 def send_simple_command(base_url: str, endpoint: str, name: str) -> None:
-    response = requests.get(f"{base_url}{endpoint}", timeout=15)
+    response = _SESSION.get(f"{base_url}{endpoint}", timeout=15)
     _print_json(f"{name} response", response.json())
 
 
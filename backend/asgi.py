@@ -0,0 +1,16 @@
+"""ASGI entrypoint for serving main.py under uvicorn.
+
+Run from the backend directory:
+
+    uv run --extra asgi uvicorn asgi:app --host "$SERVER_HOST" --port "$SERVER_PORT"
+
+Routes stay synchronous; WsgiToAsgi runs each request on its thread pool.
+"""
+
+from __future__ import annotations
+
+from asgiref.wsgi import WsgiToAsgi
+
+from main import app as wsgi_app
+
+app = WsgiToAsgi(wsgi_app)
@@ -1,9 +1,18 @@
 """Audio service utilities for ASR and TTS using fish.audio SDK."""
 from __future__ import annotations
 
+import atexit
+import hashlib
 import logging
 import os
-from typing import Callable, Optional
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Iterator, Mapping, Optional
 from dotenv import load_dotenv
 
 from fish_audio_sdk import ASRRequest, Session, TTSRequest  # type: ignore
@@ -26,13 +35,34 @@ class FishAudioClient:
 
 		self._session_factory = session_factory or (lambda: Session(self._api_key))
 		self._logger = logging.getLogger(__name__)
+		# One SDK session per client so its HTTP connections stay warm
+		self._session: Optional[Session] = None
+		self._session_lock = threading.Lock()
+		atexit.register(self.close)
 
 	def _build_session(self) -> Session:
-		try:
-			return self._session_factory()
-		except Exception as exc:  # pragma: no cover - defensive: SDK specifics may vary
-			self._logger.exception("Unable to initialize fish.audio session")
-			raise FishAudioError("Failed to initialize fish.audio session") from exc
+		session = self._session
+		if session is not None:
+			return session
+		with self._session_lock:
+			if self._session is None:
+				try:
+					self._session = self._session_factory()
+				except Exception as exc:  # pragma: no cover - defensive: SDK specifics may vary
+					self._logger.exception("Unable to initialize fish.audio session")
+					raise FishAudioError("Failed to initialize fish.audio session") from exc
+			return self._session
+
+	def close(self) -> None:
+		"""Release the cached SDK session, if one was created."""
+		with self._session_lock:
+			session, self._session = self._session, None
+		close = getattr(session, "close", None)
+		if callable(close):
+			try:
+				close()
+			except Exception:  # pragma: no cover - best effort on shutdown
+				self._logger.debug("Error closing fish.audio session", exc_info=True)
 
 	def transcribe_audio(self, audio_bytes: bytes, *, language: Optional[str] = "en") -> str:
 		"""Send raw audio bytes to the fish.audio ASR endpoint and return transcript."""
@@ -55,47 +85,242 @@ class FishAudioClient:
 
 		return transcript
 
-	def synthesize_speech(
+	def stream_speech(
 		self,
 		text: str,
 		*,
 		voice: Optional[str] = None,
 		audio_format: Optional[str] = None,
-	) -> bytes:
-		"""Generate speech audio for the provided text using fish.audio TTS."""
+	) -> Iterator[bytes]:
+		"""Yield speech audio chunks as fish.audio TTS produces them."""
 		stripped_text = text.strip()
 		if not stripped_text:
 			raise FishAudioError("text must not be empty")
 
 		session = self._build_session()
+		produced = False
 		try:
 			request = TTSRequest(text=stripped_text, reference_id=voice, format=audio_format)
-			chunks = session.tts(request)
+			for chunk in session.tts(request):
+				if chunk:  # Skip None/empty chunks
+					produced = True
+					yield chunk
 		except Exception as exc:  # pragma: no cover - delegate SDK errors
 			self._logger.exception("fish.audio TTS request failed")
 			raise FishAudioError("fish.audio TTS request failed") from exc
 
-		audio_bytes = bytearray()
-		for chunk in chunks:
-			if chunk:  # Skip None/empty chunks
-				audio_bytes.extend(chunk)
-
-		if not audio_bytes:
+		if not produced:
 			self._logger.error("fish.audio TTS response returned no audio data")
 			raise FishAudioError("fish.audio TTS response returned no audio data")
 
-		return bytes(audio_bytes)
+	def synthesize_speech(
+		self,
+		text: str,
+		*,
+		voice: Optional[str] = None,
+		audio_format: Optional[str] = None,
+	) -> bytes:
+		"""Generate speech audio for the provided text using fish.audio TTS."""
+		# Collect chunks and join once: a single allocation of the final size
+		# instead of repeated bytearray growth plus a final bytes() copy
+		return b"".join(self.stream_speech(text, voice=voice, audio_format=audio_format))
 
 
-AUDIO_FORMAT_CONTENT_TYPES: dict[str, str] = {
+# Read-only: keyed by lowercase format name
+AUDIO_FORMAT_CONTENT_TYPES: Mapping[str, str] = MappingProxyType({
 	"mp3": "audio/mpeg",
 	"mpeg": "audio/mpeg",
 	"wav": "audio/wav",
 	"pcm": "audio/L16",
 	"ogg": "audio/ogg",
-}
+})
 DEFAULT_AUDIO_CONTENT_TYPE = "audio/mpeg"
 
+
+class SpeechCache:
+	"""Byte-bounded LRU of synthesized clips, optionally mirrored on disk.
+
+	Entries are keyed by (voice, format, text), so a hit returns exactly what
+	fish.audio produced for the same request. The disk copy lets repeated
+	phrases (fallbacks, confirmations) survive a restart.
+	"""
+
+	def __init__(self, max_bytes: int, directory: Optional[str] = None, disk_max_bytes: int = 0) -> None:
+		self._max_bytes = max_bytes
+		self._entries: OrderedDict[str, bytes] = OrderedDict()
+		self._size = 0
+		self._lock = threading.Lock()
+		self._directory = Path(directory) if directory else None
+		self._disk_max_bytes = disk_max_bytes
+		self._logger = logging.getLogger(__name__)
+
+	@staticmethod
+	def key(text: str, voice: Optional[str], audio_format: Optional[str]) -> str:
+		return hashlib.blake2b(f"{voice}|{audio_format}|{text}".encode(), digest_size=16).hexdigest()
+
+	def get(self, key: str) -> Optional[bytes]:
+		with self._lock:
+			audio_bytes = self._entries.get(key)
+			if audio_bytes is not None:
+				self._entries.move_to_end(key)
+				return audio_bytes
+		if self._directory is None:
+			return None
+
+		path = self._directory / f"{key}.bin"
+		try:
+			audio_bytes = path.read_bytes()
+			os.utime(path)  # Disk entries are evicted oldest-mtime first
+		except OSError:
+			return None
+		if not audio_bytes:
+			return None
+		self._remember(key, audio_bytes)
+		return audio_bytes
+
+	def put(self, key: str, audio_bytes: bytes) -> None:
+		self._remember(key, audio_bytes)
+		if self._directory is not None:
+			self._persist(key, audio_bytes)
+
+	def _remember(self, key: str, audio_bytes: bytes) -> None:
+		if len(audio_bytes) > self._max_bytes:
+			return
+		with self._lock:
+			previous = self._entries.pop(key, None)
+			if previous is not None:
+				self._size -= len(previous)
+			self._entries[key] = audio_bytes
+			self._size += len(audio_bytes)
+			while self._size > self._max_bytes:
+				_, evicted = self._entries.popitem(last=False)
+				self._size -= len(evicted)
+
+	def _persist(self, key: str, audio_bytes: bytes) -> None:
+		assert self._directory is not None
+		path = self._directory / f"{key}.bin"
+		partial = path.with_name(f"{key}.{os.getpid()}.{threading.get_ident()}.tmp")
+		try:
+			self._directory.mkdir(parents=True, exist_ok=True)
+			partial.write_bytes(audio_bytes)
+			os.replace(partial, path)
+		except OSError as exc:
+			self._logger.debug("Unable to persist TTS cache entry %s: %s", key, exc)
+			partial.unlink(missing_ok=True)
+			return
+		self._prune_disk()
+
+	def _prune_disk(self) -> None:
+		assert self._directory is not None
+		try:
+			entries = []
+			total = 0
+			with os.scandir(self._directory) as it:
+				for entry in it:
+					if entry.name.endswith(".bin") and entry.is_file():
+						stat = entry.stat()
+						entries.append((stat.st_mtime, stat.st_size, entry.path))
+						total += stat.st_size
+		except OSError:
+			return
+		if total <= self._disk_max_bytes:
+			return
+		entries.sort()
+		for _, size, path in entries:
+			try:
+				os.unlink(path)
+			except OSError:
+				continue
+			total -= size
+			if total <= self._disk_max_bytes:
+				break
+
+
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+# Set TTS_CACHE_DIR to an empty string to keep the cache in memory only
+TTS_CACHE_DIR = os.getenv("TTS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "tts_cache"))
+TTS_CACHE_DISK_MAX_BYTES = int(os.getenv("TTS_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024)))
+
+_speech_cache = SpeechCache(TTS_CACHE_MAX_BYTES, TTS_CACHE_DIR, TTS_CACHE_DISK_MAX_BYTES)
+
+
+# Cached clips are replayed in pieces so a hit streams like a live synthesis
+CACHED_STREAM_CHUNK_SIZE = 16 * 1024
+
+
+def _replay_cached(audio_bytes: bytes) -> Iterator[bytes]:
+	for offset in range(0, len(audio_bytes), CACHED_STREAM_CHUNK_SIZE):
+		yield audio_bytes[offset:offset + CACHED_STREAM_CHUNK_SIZE]
+
+
+# One synthesis per cache key at a time; concurrent callers share its Future
+_in_flight: dict[str, Future[bytes]] = {}
+_in_flight_lock = threading.Lock()
+
+
+def _release_in_flight(key: str, future: Future[bytes]) -> None:
+	with _in_flight_lock:
+		if _in_flight.get(key) is future:
+			del _in_flight[key]
+
+
+def _cache_stream(key: str, chunks: Iterator[bytes], future: Future[bytes]) -> Iterator[bytes]:
+	"""Pass chunks through, then cache the clip and resolve its Future."""
+	produced = []
+	try:
+		for chunk in chunks:
+			produced.append(chunk)
+			yield chunk
+	except BaseException as exc:
+		# Errors and abandoned streams (GeneratorExit) are not cached
+		if isinstance(exc, GeneratorExit):
+			exc = FishAudioError("speech stream was abandoned")
+		future.set_exception(exc)
+		raise
+	else:
+		audio_bytes = b"".join(produced)
+		_speech_cache.put(key, audio_bytes)
+		future.set_result(audio_bytes)
+	finally:
+		_release_in_flight(key, future)
+
+
+def _abandon_stream(key: str, future: Future[bytes]) -> None:
+	# A stream dropped before its first chunk never runs _cache_stream's body
+	if not future.done():
+		future.set_exception(FishAudioError("speech stream was abandoned"))
+	_release_in_flight(key, future)
+
+
+def _synthesize_once(key: str, text: str, voice: Optional[str], audio_format: Optional[str]) -> bytes:
+	with _in_flight_lock:
+		future = _in_flight.get(key)
+		owner = future is None
+		if owner:
+			future = _in_flight[key] = Future()
+	if not owner:
+		return future.result()
+
+	try:
+		# A synthesis that finished just before we took ownership is cached
+		audio_bytes = _speech_cache.get(key)
+		if audio_bytes is None:
+			audio_bytes = _fish_audio_client.synthesize_speech(text, voice=voice, audio_format=audio_format)
+			_speech_cache.put(key, audio_bytes)
+	except BaseException as exc:
+		future.set_exception(exc)
+		raise
+	else:
+		future.set_result(audio_bytes)
+		return audio_bytes
+	finally:
+		_release_in_flight(key, future)
+
+
+def _replay_pending(future: Future[bytes]) -> Iterator[bytes]:
+	yield from _replay_cached(future.result())
+
+
 # Initialize FishAudioClient
 try:
 	_fish_audio_client = FishAudioClient()
@@ -152,4 +377,54 @@ def synthesize_speech_from_text(
 	if not text or not str(text).strip():
 		raise ValueError("text must not be empty")
 	
-	return _fish_audio_client.synthesize_speech(str(text), voice=voice, audio_format=audio_format)
+	stripped_text = str(text).strip()
+	key = SpeechCache.key(stripped_text, voice, audio_format)
+	cached = _speech_cache.get(key)
+	if cached is not None:
+		return cached
+
+	return _synthesize_once(key, stripped_text, voice, audio_format)
+
+
+def stream_speech_from_text(
+	text: str,
+	voice: Optional[str] = None,
+	audio_format: Optional[str] = None,
+) -> Iterator[bytes]:
+	"""Stream synthesized speech chunks for the provided text via fish.audio TTS.
+	
+	Errors surface when the returned iterator is first advanced.
+	
+	Raises:
+		FishAudioError: If audio service is unavailable or synthesis fails
+		ValueError: If text is empty
+	"""
+	if _fish_audio_client is None:
+		raise FishAudioError("Audio service not available")
+	
+	if not text or not str(text).strip():
+		raise ValueError("text must not be empty")
+	
+	stripped_text = str(text).strip()
+	key = SpeechCache.key(stripped_text, voice, audio_format)
+	cached = _speech_cache.get(key)
+	if cached is not None:
+		return _replay_cached(cached)
+
+	with _in_flight_lock:
+		pending = _in_flight.get(key)
+		if pending is None:
+			future = _in_flight[key] = Future()
+	if pending is not None:
+		# The same clip is already being synthesized; replay it when done
+		return _replay_pending(pending)
+
+	try:
+		chunks = _fish_audio_client.stream_speech(stripped_text, voice=voice, audio_format=audio_format)
+	except BaseException as exc:
+		future.set_exception(exc)
+		_release_in_flight(key, future)
+		raise
+	stream = _cache_stream(key, chunks, future)
+	weakref.finalize(stream, _abandon_stream, key, future)
+	return stream
@@ -1,12 +1,13 @@
 """Flask server for audio recording and streaming with VAD and interruption handling."""
 from __future__ import annotations
 
-import base64
+import functools
 import logging
 import os
 import queue
 import threading
 import time
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
@@ -17,6 +18,16 @@ from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
 
+try:
+    import opuslib  # type: ignore
+except Exception:  # pragma: no cover - optional codec, needs libopus
+    opuslib = None
+
+try:  # SIMD base64 with the stdlib API, when installed
+    import pybase64 as base64  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    import base64
+
 # Load environment variables
 DOTENV_PATH = Path(__file__).resolve().parent.parent / ".env"
 load_dotenv(dotenv_path=DOTENV_PATH)
@@ -27,6 +38,8 @@ logger = logging.getLogger(__name__)
 DEFAULT_SAMPLE_RATE = 48000
 DEFAULT_CHANNELS = 2
 CHUNK_SIZE = 1024
+# Interleaved int16 PCM -> (frames, channels), the layout OutputStream expects
+PLAYBACK_FRAME_SHAPE = (-1, DEFAULT_CHANNELS)
 
 # Voice Activity Detection (VAD) configuration
 # Energy is normalized RMS (0.0 to 1.0 scale after dividing by 32768)
@@ -36,18 +49,47 @@ VAD_MIN_SPEECH_DURATION = 0.3  # Minimum speech duration in seconds
 VAD_MAX_SILENCE_DURATION = 1.5  # Maximum silence before ending utterance
 VAD_BUFFER_DURATION = 0.1  # Pre-buffer duration to capture speech onset
 
+# Events raised in the audio callback are queued and emitted from a sender
+# thread; past this many pending events the oldest is dropped
+TX_QUEUE_MAX = 256
+# Capture blocks per audio_chunk emit (4 x 1024 frames ~= 85ms at 48kHz)
+AUDIO_EMIT_BATCH = max(1, int(os.getenv("AUDIO_EMIT_BATCH", "4")))
+# Codec for the audio_chunk stream to main.py: "pcm" (raw int16) or "opus".
+# Opus (optional opuslib + libopus) cuts ~1.5 Mbps of stereo PCM to OPUS_BITRATE.
+AUDIO_STREAM_CODEC = os.getenv("AUDIO_STREAM_CODEC", "pcm").lower()
+OPUS_BITRATE = int(os.getenv("OPUS_BITRATE", "64000"))
+OPUS_FRAME_SAMPLES = DEFAULT_SAMPLE_RATE // 50  # 20ms frames
+OPUS_FRAME_BYTES = OPUS_FRAME_SAMPLES * DEFAULT_CHANNELS * 2
+# Clips waiting for playback; past this the oldest pending clip is dropped
+PLAYBACK_QUEUE_MAX = 32
+
 # Optional: Specify device names from environment
 # For system audio capture, use something like "BlackHole 2ch"
 INPUT_DEVICE_NAME = os.getenv("AUDIO_INPUT_DEVICE", None)
 OUTPUT_DEVICE_NAME1 = os.getenv("AUDIO_OUTPUT_DEVICE1", None)
 OUTPUT_DEVICE_NAME2 = os.getenv("AUDIO_OUTPUT_DEVICE2", None)
 
-# Debug configuration
+# Debug configuration (CALL_DEBUG=true enables Flask debug mode when run directly)
 DEBUG_AUDIO_LEVELS = os.getenv("DEBUG_AUDIO_LEVELS", "false").lower() == "true"
 print(f"[STARTUP] DEBUG_AUDIO_LEVELS environment variable: {os.getenv('DEBUG_AUDIO_LEVELS', 'NOT SET')}")
 print(f"[STARTUP] DEBUG_AUDIO_LEVELS resolved to: {DEBUG_AUDIO_LEVELS}")
 
 
+@functools.lru_cache(maxsize=1)
+def _cached_devices():
+    """Snapshot of PortAudio devices; enumeration hits the OS audio stack."""
+    return sd.query_devices()
+
+
+@functools.lru_cache(maxsize=1)
+def _device_table() -> list[tuple[str, int, int, int]]:
+    """(lowercase name, index, input channels, output channels) per device."""
+    return [
+        (device["name"].lower(), idx, device["max_input_channels"], device["max_output_channels"])
+        for idx, device in enumerate(_cached_devices())
+    ]
+
+
 class AudioManager:
     """Manages audio recording and playback with VAD and interruption handling."""
 
@@ -69,11 +111,40 @@ class AudioManager:
         self.pre_buffer = []
         self.pre_buffer_size = int(VAD_BUFFER_DURATION * DEFAULT_SAMPLE_RATE / CHUNK_SIZE)
         
+        # Outgoing Socket.IO events, drained off the realtime audio thread
+        self.tx_queue: queue.Queue = queue.Queue(maxsize=TX_QUEUE_MAX)
+        self.tx_thread = None
+        # Capture blocks accumulated for the next audio_chunk emit
+        self._pending_audio = bytearray()
+        self._pending_blocks = 0
+        self._opus_encoder = None
+        if AUDIO_STREAM_CODEC == "opus":
+            if opuslib is None:
+                logger.warning("AUDIO_STREAM_CODEC=opus but opuslib is unavailable; streaming raw PCM")
+            else:
+                self._opus_encoder = opuslib.Encoder(DEFAULT_SAMPLE_RATE, DEFAULT_CHANNELS, opuslib.APPLICATION_VOIP)
+                self._opus_encoder.bitrate = OPUS_BITRATE
+        
         # Playback interruption control
         self.playback_active = False
         self.playback_interrupt_event = threading.Event()
         self.current_playback_stream = None
         
+        # Persistent output stream fed from a buffer of (frames, channels)
+        # int16 blocks; opened on first playback and kept open between clips
+        self._out_stream: Optional[sd.OutputStream] = None
+        self._out_device: Optional[int] = None
+        self._out_stream_lock = threading.Lock()
+        self._out_buf: deque = deque()
+        self._out_lock = threading.Lock()
+        self._out_drained = threading.Event()
+        self._out_drained.set()
+        
+        # Single consumer that plays queued clips in order
+        self.playback_queue: queue.Queue = queue.Queue(maxsize=PLAYBACK_QUEUE_MAX)
+        self._player_thread = threading.Thread(target=self._player_worker, daemon=True)
+        self._player_thread.start()
+        
         # Audio level monitoring for debugging
         self.debug_audio_levels = DEBUG_AUDIO_LEVELS
         self.last_input_level_emit = 0
@@ -168,15 +239,16 @@ class AudioManager:
     def _find_device(self, device_name: str, device_type: str) -> Optional[int]:
         """Find device index by name."""
         logger.debug(f"Searching for {device_type} device: {device_name}")
-        devices = sd.query_devices()
-        for idx, device in enumerate(devices):
-            if device_name.lower() in device["name"].lower():
-                if device_type == "input" and device["max_input_channels"] > 0:
-                    logger.debug(f"Found {device_type} device '{device['name']}' at index {idx}")
-                    return idx
-                elif device_type == "output" and device["max_output_channels"] > 0:
-                    logger.debug(f"Found {device_type} device '{device['name']}' at index {idx}")
-                    return idx
+        key = device_name.lower()
+        channels = 2 if device_type == "input" else 3 if device_type == "output" else None
+        if channels is not None:
+            idx = next(
+                (row[1] for row in _device_table() if key in row[0] and row[channels] > 0),
+                None
+            )
+            if idx is not None:
+                logger.debug(f"Found {device_type} device '{_cached_devices()[idx]['name']}' at index {idx}")
+                return idx
         logger.debug(f"{device_type.capitalize()} device '{device_name}' not found")
         return None
     
@@ -198,7 +270,7 @@ class AudioManager:
         """Worker thread for continuous audio recording."""
         logger.info("Recording worker thread started")
         try:
-            with sd.InputStream(
+            with sd.RawInputStream(
                 samplerate=DEFAULT_SAMPLE_RATE,
                 channels=DEFAULT_CHANNELS,
                 dtype="int16",
@@ -220,20 +292,25 @@ class AudioManager:
         if status:
             logger.warning(f"Audio callback status: {status}")
         
+        # RawInputStream hands over a bare buffer that PortAudio reuses after
+        # the callback returns: take one bytes copy and view it as samples
+        chunk = bytes(indata)
+        samples = np.frombuffer(chunk, dtype=np.int16)
+        
         # Calculate energy for VAD (normalize by int16 max value)
-        audio_array = indata.astype(np.float32) / 32768.0  # Normalize to -1.0 to 1.0
+        audio_array = samples.astype(np.float32) / 32768.0  # Normalize to -1.0 to 1.0
         energy = np.sqrt(np.mean(audio_array ** 2))
         
         # Emit audio levels for debugging (throttled)
         if self.debug_audio_levels and self.socketio:
             current_time = time.time()
             if current_time - self.last_input_level_emit >= self.level_emit_interval:
-                audio_level_db = self._calculate_audio_level_db(indata)
-                self.socketio.emit('input_audio_level', {
+                audio_level_db = self._calculate_audio_level_db(samples)
+                self._queue_emit('input_audio_level', {
                     'level_db': round(audio_level_db, 2),
                     'energy': round(float(energy), 6),
                     'is_speaking': self.is_speaking
-                }, namespace='/')
+                })
                 self.last_input_level_emit = current_time
                 self.input_level_emit_count += 1
                 # Log every 50 emissions (about every 5 seconds) to confirm it's working
@@ -246,7 +323,7 @@ class AudioManager:
                 self._socketio_warning_logged = True
         
         # Maintain pre-buffer for capturing speech onset
-        self.pre_buffer.append(indata.copy())
+        self.pre_buffer.append(chunk)
         if len(self.pre_buffer) > self.pre_buffer_size:
             self.pre_buffer.pop(0)
         
@@ -264,25 +341,25 @@ class AudioManager:
                 # Send utterance_start event
                 self._send_utterance_start()
                 
-                # Send pre-buffer chunks
-                for chunk in self.pre_buffer:
-                    self._send_audio_chunk(chunk)
+                # Send pre-buffer chunks (minus the current one, sent below)
+                for buffered in self.pre_buffer[:-1]:
+                    self._send_audio_chunk(buffered)
                 
                 # Interrupt any ongoing playback
                 if self.playback_active:
                     self.interrupt_playback()
             
             # Send current audio chunk
-            self._send_audio_chunk(indata.copy())
-            self.current_utterance.append(indata.copy())
+            self._send_audio_chunk(chunk)
+            self.current_utterance.append(chunk)
             self.speech_frames += 1
             
         else:
             # Silence detected
             if self.is_speaking:
                 # Still send silence chunks during trailing silence
-                self._send_audio_chunk(indata.copy())
-                self.current_utterance.append(indata.copy())
+                self._send_audio_chunk(chunk)
+                self.current_utterance.append(chunk)
                 self.silence_frames += 1
                 
                 # Check if silence duration exceeds threshold
@@ -296,12 +373,15 @@ class AudioManager:
                         self._send_utterance_end(speech_duration)
                     else:
                         logger.info(f"Discarding short utterance ({speech_duration:.2f}s < {VAD_MIN_SPEECH_DURATION}s minimum)")
-                        # Send utterance_cancelled event
+                        # Send utterance_cancelled event; main.py discards the
+                        # audio, so buffered blocks are dropped rather than sent
+                        self._pending_audio.clear()
+                        self._pending_blocks = 0
                         if self.socketio:
-                            self.socketio.emit('utterance_cancelled', {
+                            self._queue_emit('utterance_cancelled', {
                                 'reason': 'too_short',
                                 'duration': speech_duration
-                            }, namespace='/')
+                            })
                     
                     # Reset state
                     self.is_speaking = False
@@ -317,6 +397,8 @@ class AudioManager:
         
         self.audio_chunks_sent = 0
         self.recording = True
+        if self.socketio and (self.tx_thread is None or not self.tx_thread.is_alive()):
+            self.tx_thread = self.socketio.start_background_task(self._drain_tx)
         self.recording_thread = threading.Thread(target=self._recording_worker, daemon=True)
         self.recording_thread.start()
         logger.info(f"Started recording from device index {self.input_device_index}")
@@ -338,41 +420,102 @@ class AudioManager:
         logger.info(f"Recording stopped. Total chunks sent: {self.audio_chunks_sent}")
         return True
 
+    def _queue_emit(self, event: str, data: dict):
+        """Hand an event to the sender thread without blocking the caller."""
+        while True:
+            try:
+                self.tx_queue.put_nowait((event, data))
+                return
+            except queue.Full:
+                # Keep the realtime path moving: drop the oldest pending event
+                try:
+                    self.tx_queue.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _drain_tx(self):
+        """Emit queued events until recording stops and the queue is empty."""
+        while self.recording or not self.tx_queue.empty():
+            try:
+                event, data = self.tx_queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
+                self.socketio.emit(event, data, namespace='/')
+            except Exception as e:
+                logger.error(f"Failed to emit {event}: {e}")
+
     def _send_utterance_start(self):
         """Send utterance_start event to main.py."""
         if not self.socketio:
             return
         
-        self.socketio.emit('utterance_start', {
+        self._queue_emit('utterance_start', {
             'timestamp': time.time()
-        }, namespace='/')
-        logger.info("➡️  Sent utterance_start event to main.py")
+        })
+        logger.info("➡️  Queued utterance_start event to main.py")
     
-    def _send_audio_chunk(self, audio_chunk: np.ndarray):
-        """Send a single audio chunk to main.py."""
+    def _send_audio_chunk(self, audio_bytes: bytes):
+        """Buffer a capture block, sending every AUDIO_EMIT_BATCH blocks to main.py."""
         if not self.socketio:
             return
         
-        # Convert to bytes and encode
-        audio_bytes = audio_chunk.astype(np.int16).tobytes()
-        audio_b64 = base64.b64encode(audio_bytes).decode('utf-8')
+        self._pending_audio += audio_bytes
+        self._pending_blocks += 1
+        if self._pending_blocks >= AUDIO_EMIT_BATCH:
+            self._flush_audio_chunks()
+    
+    def _flush_audio_chunks(self, final: bool = False):
+        """Emit any buffered capture blocks as one audio_chunk."""
+        if not self._pending_audio:
+            return
+        self._pending_blocks = 0
+        
+        if self._opus_encoder is not None:
+            self._flush_opus_frames(final)
+            return
+        
+        audio_bytes = bytes(self._pending_audio)
+        self._pending_audio.clear()
         
-        self.socketio.emit('audio_chunk', {
-            'audio': audio_b64,
+        # Raw int16 PCM goes out as a binary Socket.IO attachment (no base64)
+        self._queue_emit('audio_chunk', {
+            'audio': audio_bytes,
             'size': len(audio_bytes)
-        }, namespace='/')
+        })
+    
+    def _flush_opus_frames(self, final: bool):
+        """Encode whole 20ms frames as Opus packets; the remainder waits for more audio."""
+        if final and len(self._pending_audio) % OPUS_FRAME_BYTES:
+            # Pad the utterance tail with silence to a whole frame
+            self._pending_audio += bytes(OPUS_FRAME_BYTES - len(self._pending_audio) % OPUS_FRAME_BYTES)
+        
+        usable = len(self._pending_audio) - len(self._pending_audio) % OPUS_FRAME_BYTES
+        packets = [
+            self._opus_encoder.encode(bytes(self._pending_audio[i:i + OPUS_FRAME_BYTES]), OPUS_FRAME_SAMPLES)
+            for i in range(0, usable, OPUS_FRAME_BYTES)
+        ]
+        del self._pending_audio[:usable]
+        if packets:
+            self._queue_emit('audio_chunk', {
+                'audio': packets,
+                'codec': 'opus',
+                'size': usable
+            })
     
     def _send_utterance_end(self, duration: float):
         """Send utterance_end event to main.py."""
         if not self.socketio:
             return
         
-        self.socketio.emit('utterance_end', {
+        # The tail of the utterance must reach main.py before the end marker
+        self._flush_audio_chunks(final=True)
+        self._queue_emit('utterance_end', {
             'duration': duration,
             'timestamp': time.time(),
             'total_chunks': len(self.current_utterance)
-        }, namespace='/')
-        logger.info(f"✅ Sent utterance_end to main.py: {duration:.2f}s, {len(self.current_utterance)} chunks")
+        })
+        logger.info(f"✅ Queued utterance_end to main.py: {duration:.2f}s, {len(self.current_utterance)} chunks")
         self.audio_chunks_sent += 1
     
     def interrupt_playback(self):
@@ -380,54 +523,113 @@ class AudioManager:
         if self.playback_active:
             logger.info("Interrupting playback due to user speech")
             self.playback_interrupt_event.set()
-            sd.stop()
+            # Drop clips still waiting behind the interrupted one as well
+            while True:
+                try:
+                    self.playback_queue.get_nowait()
+                except queue.Empty:
+                    break
+            with self._out_lock:
+                self._out_buf.clear()
+                self._out_drained.set()
             self.playback_active = False
             
             # Notify main.py about interruption
             if self.socketio:
-                self.socketio.emit('playback_interrupted', {}, namespace='/')
+                self._queue_emit('playback_interrupted', {})
     
+    def _ensure_output_stream(self, device_index: Optional[int]):
+        """Open (or move) the persistent output stream to ``device_index``."""
+        with self._out_stream_lock:
+            if self._out_stream is not None and self._out_device == device_index:
+                return
+            if self._out_stream is not None:
+                self._out_stream.close()
+            self._out_stream = sd.OutputStream(
+                samplerate=DEFAULT_SAMPLE_RATE,
+                channels=DEFAULT_CHANNELS,
+                dtype="int16",
+                device=device_index,
+                callback=self._output_callback
+            )
+            self._out_stream.start()
+            self._out_device = device_index
+            logger.info(f"Output stream opened on device index {device_index}")
+
+    def _output_callback(self, outdata, frames, time_info, status):
+        """Feed the output stream from the pending buffer, padding with silence."""
+        if status:
+            logger.warning(f"Output callback status: {status}")
+        
+        filled = 0
+        with self._out_lock:
+            while filled < frames and self._out_buf:
+                block = self._out_buf[0]
+                take = min(frames - filled, len(block))
+                outdata[filled:filled + take] = block[:take]
+                if take == len(block):
+                    self._out_buf.popleft()
+                else:
+                    self._out_buf[0] = block[take:]
+                filled += take
+            if not self._out_buf:
+                self._out_drained.set()
+        if filled < frames:
+            outdata[filled:] = 0
+
+    def enqueue_output(self, audio_bytes: bytes) -> bool:
+        """Queue a clip for playback; returns False if an older clip was dropped."""
+        try:
+            self.playback_queue.put_nowait(audio_bytes)
+            return True
+        except queue.Full:
+            try:
+                self.playback_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self.playback_queue.put_nowait(audio_bytes)
+            logger.warning("Playback queue full, dropped the oldest pending clip")
+            return False
+
+    def _player_worker(self):
+        """Play queued clips one at a time."""
+        while True:
+            audio_bytes = self.playback_queue.get()
+            self.output_audio(audio_bytes)
+
     def output_audio(self, audio_bytes: bytes):
         """Output audio bytes with interruption support."""
         try:
-            logger.debug(f"Starting audio output: {len(audio_bytes)} bytes")
+            logger.debug("Starting audio output: %d bytes", len(audio_bytes))
             self.playback_active = True
             self.playback_interrupt_event.clear()
             
-            # Convert bytes to numpy array (int16 samples)
-            audio_array = np.frombuffer(audio_bytes, dtype=np.int16)
+            # Read-only (frames, channels) view over the received bytes; the
+            # output callback only copies out of it, so no writable copy is made
+            audio_array = np.frombuffer(audio_bytes, dtype=np.int16).reshape(PLAYBACK_FRAME_SHAPE)
             
-            # Reshape interleaved stereo data to (N, 2) for sounddevice
-            if DEFAULT_CHANNELS == 2:
-                audio_array = audio_array.reshape(-1, 2)
-            elif DEFAULT_CHANNELS == 1:
-                # Keep as 1D for mono
-                pass
+            device_index = self.output_device_index_recording if self.recording else self.output_device_index_idle
+            self._ensure_output_stream(device_index)
+            
+            with self._out_lock:
+                self._out_buf.append(audio_array)
+                self._out_drained.clear()
             
-            # Play audio in chunks to allow interruption
-            chunk_samples = CHUNK_SIZE * 4  # Larger chunks for smoother playback
-            for i in range(0, len(audio_array), chunk_samples):
+            # Wait for the stream to drain the clip, checking for interruption
+            # and emitting output audio levels for debugging (throttled)
+            while not self._out_drained.wait(self.level_emit_interval):
                 if self.playback_interrupt_event.is_set():
                     logger.info("Playback interrupted")
                     break
-                    
-                chunk = audio_array[i:i+chunk_samples]
-                
-                # Emit output audio levels for debugging (throttled)
                 if self.debug_audio_levels and self.socketio:
-                    current_time = time.time()
-                    if current_time - self.last_output_level_emit >= self.level_emit_interval:
-                        # Convert chunk to int16 for level calculation if needed
-                        chunk_int16 = chunk if chunk.dtype == np.int16 else chunk.astype(np.int16)
-                        audio_level_db = self._calculate_audio_level_db(chunk_int16)
+                    with self._out_lock:
+                        current = self._out_buf[0][:CHUNK_SIZE * 4] if self._out_buf else None
+                    if current is not None and len(current):
+                        audio_level_db = self._calculate_audio_level_db(current)
                         self.socketio.emit('output_audio_level', {
                             'level_db': round(audio_level_db, 2)
                         }, namespace='/')
-                        self.last_output_level_emit = current_time
-                
-                device_index = self.output_device_index_recording if self.recording else self.output_device_index_idle
-                sd.play(chunk, samplerate=DEFAULT_SAMPLE_RATE, device=device_index)
-                sd.wait()
+                        self.last_output_level_emit = time.time()
             
             if not self.playback_interrupt_event.is_set():
                 logger.info(f"Audio playback completed: {len(audio_bytes)} bytes")
@@ -442,8 +644,17 @@ class AudioManager:
 # Initialize Flask app and extensions
 app = Flask(__name__)
 CORS(app)
-# Increase max message size to 10MB to handle large audio files
-socketio = SocketIO(app, cors_allowed_origins="*", max_http_buffer_size=10_000_000)
+# Increase max message size to 10MB to handle large audio files.
+# Threading mode (not eventlet/gevent): monkey patching would turn the
+# recording, sender and player threads into green threads that stall on
+# PortAudio. With simple-websocket installed, clients get a real WebSocket
+# transport instead of HTTP long-polling, each served on its own thread.
+socketio = SocketIO(
+    app,
+    async_mode="threading",
+    cors_allowed_origins="*",
+    max_http_buffer_size=10_000_000
+)
 
 # Initialize audio manager
 audio_manager = AudioManager(
@@ -464,7 +675,7 @@ logger.info(
 @app.route('/devices', methods=['GET'])
 def list_devices():
     """List available audio devices."""
-    devices = sd.query_devices()
+    devices = _cached_devices()
     device_list = []
     for idx, device in enumerate(devices):
         device_list.append({
@@ -524,11 +735,14 @@ def handle_stop_recording(_data=None):
         emit('recording_error', {'message': 'Not currently recording'})
 
 
-@socketio.on('*')
-def catch_all(event, data):
-    """Catch all events for debugging."""
-    from flask import request
-    logger.info(f"Event received: '{event}' from {request.sid}")
+if os.getenv("DEBUG_SOCKET_EVENTS", "false").lower() == "true":
+    # Only registered on request: a catch-all runs on every Socket.IO event
+    @socketio.on('*')
+    def catch_all(event, data):
+        """Catch all events for debugging."""
+        from flask import request
+        logger.debug("Event received: '%s' from %s", event, request.sid)
+
 
 @socketio.on('audio_input')
 def handle_audio_input(data):
@@ -536,18 +750,21 @@ def handle_audio_input(data):
     from flask import request
     logger.info(f"Audio input event received from {request.sid}")
     try:
-        # Decode base64 audio
-        audio_b64 = data.get('audio') if data else None
-        if not audio_b64:
+        # Audio arrives as a binary attachment; base64 text is still accepted
+        audio_payload = data.get('audio') if data else None
+        if not audio_payload:
             logger.warning(f"No audio data received from {request.sid}")
             emit('error', {'message': 'No audio data received'})
             return
         
-        audio_bytes = base64.b64decode(audio_b64)
+        if isinstance(audio_payload, (bytes, bytearray)):
+            audio_bytes = bytes(audio_payload)
+        else:
+            audio_bytes = base64.b64decode(audio_payload)
         logger.info(f"Received audio input from {request.sid}: {len(audio_bytes)} bytes")
 
-        # Output audio using current defaults in a separate thread to avoid blocking
-        threading.Thread(target=audio_manager.output_audio, args=(audio_bytes,), daemon=True).start()
+        # Queue for the single player thread; clips play in arrival order
+        audio_manager.enqueue_output(audio_bytes)
         
         emit('audio_received', {'status': 'Audio received and queued for output'})
         
@@ -571,11 +788,14 @@ if __name__ == "__main__":
     logger.info(f"Starting audio call server on {host}:{port}")
     logger.info(f"DEBUG_AUDIO_LEVELS: {DEBUG_AUDIO_LEVELS}")
     logger.info(f"Available audio devices:")
-    devices = sd.query_devices()
+    devices = _cached_devices()
     for idx, device in enumerate(devices):
         if device['max_input_channels'] > 0 or device['max_output_channels'] > 0:
             logger.info(f"  [{idx}] {device['name']}: in={device['max_input_channels']}, out={device['max_output_channels']}")
     
     logger.info("SocketIO server initialized with max message size: 10MB")
 
-    socketio.run(app, host=host, port=port, debug=True, log_output=False, allow_unsafe_werkzeug=True)
+    # Debug mode adds the reloader (which would open the audio devices twice)
+    # and debugger middleware on every request, so it is opt-in
+    debug = os.getenv("CALL_DEBUG", "false").lower() == "true"
+    socketio.run(app, host=host, port=port, debug=debug, log_output=False, allow_unsafe_werkzeug=True)
@@ -0,0 +1,29 @@
+"""Gunicorn settings for serving main.py with gevent workers.
+
+Run from the backend directory (main.py imports ``audio`` as a top-level
+module):
+
+    uv run --extra gevent gunicorn -c gunicorn_conf.py main:app
+
+main.py keeps per-process state (the last iMessage requester, the utterance
+buffer and the Socket.IO link to call.py), so it runs as a single worker;
+concurrency comes from gevent's cooperative connections instead.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / ".env")
+
+bind = f"{os.environ['SERVER_HOST']}:{os.environ['SERVER_PORT']}"
+worker_class = "gevent"
+workers = 1
+worker_connections = int(os.getenv("BACKEND_WORKER_CONNECTIONS", "1000"))
+keepalive = 5
+# Agent-S forwards and TTS can legitimately take longer than the 30s default
+timeout = int(float(os.getenv("BACKEND_HTTP_TIMEOUT", "60"))) + 30
+loglevel = os.getenv("BACKEND_LOG_LEVEL", "INFO").lower()
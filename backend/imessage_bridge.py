@@ -8,29 +8,52 @@ contact.
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
 import logging
 import os
+import select
 import shutil
 import sqlite3
 import subprocess
+import tempfile
 import threading
 import time
 import uuid
-from contextlib import closing
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, jsonify, request
+from werkzeug.datastructures import FileStorage
+from werkzeug.utils import secure_filename
 from dotenv import load_dotenv
 
+try:  # Optional production WSGI server; falls back to Flask's built-in one
+    from waitress import serve as waitress_serve
+except ImportError:  # pragma: no cover - optional dependency
+    waitress_serve = None
 
-APPLE_EPOCH = datetime(2001, 1, 1, tzinfo=timezone.utc)
+
+# Apple's Core Data epoch (2001-01-01 UTC) as Unix seconds
+APPLE_EPOCH_UNIX = int(datetime(2001, 1, 1, tzinfo=timezone.utc).timestamp())
 CHAT_DB_PATH = Path.home() / "Library/Messages/chat.db"
+CHAT_DB_WAL_PATH = CHAT_DB_PATH.with_name(CHAT_DB_PATH.name + "-wal")
 PICTURES_DIR = Path.home() / "Pictures"
 IMESSAGE_COMMAND = "imessage"
+OSASCRIPT_COMMAND = "osascript"
+OSACOMPILE_COMMAND = "osacompile"
+MESSAGES_HELPER_TIMEOUT = 30.0
+ATTACHMENT_WORKERS = 4
+SERVER_THREADS = 8
+MAX_SEND_JOBS = 256
 DEFAULT_CONTACT = None
 DEFAULT_INTERVAL = 5.0
 DEFAULT_LOG_LEVEL = "INFO"
@@ -38,6 +61,74 @@ ENV_PATH = Path(__file__).resolve().parent.parent / ".env"
 load_dotenv(dotenv_path=ENV_PATH)
 
 BACKEND_TIMEOUT = 30
+# Bodies are pre-encoded with orjson rather than requests' stdlib json=
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Applied on every chat.db connection. The database is opened read-only, so
+# journal_mode/synchronous (writer settings) are left to Messages itself;
+# these only make reads cheaper: mmap'd pages and a 20 MB page cache.
+CHAT_DB_PRAGMAS = """
+PRAGMA query_only = 1;
+PRAGMA temp_store = MEMORY;
+PRAGMA mmap_size = 268435456;
+PRAGMA cache_size = -20000;
+PRAGMA automatic_index = ON;
+"""
+
+CONTACT_FILTER_CLAUSE = """
+    AND (
+        chat.display_name = ?
+        OR chat.guid = ?
+        OR COALESCE(handle.id, '') = ?
+    )
+"""
+# Walking message's primary key backwards stops at the first match; MAX()
+# over the joins would visit every matching row first. No row means 0.
+LATEST_ROWID_SQL = """
+    SELECT message.ROWID
+    FROM message
+    JOIN chat_message_join cmj ON cmj.message_id = message.ROWID
+    JOIN chat ON chat.ROWID = cmj.chat_id
+    LEFT JOIN handle ON handle.ROWID = message.handle_id
+    WHERE message.is_from_me = 0
+    {filter_clause}
+    ORDER BY message.ROWID DESC
+    LIMIT 1
+"""
+# Grouping on message.ROWID (the scan order) dedupes without a temp b-tree,
+# and the participant count comes from one outer join instead of a
+# correlated subquery per row. Apple dates (seconds or nanoseconds since
+# 2001) are normalised to Unix seconds here for the whole batch at once.
+FETCH_MESSAGES_SQL = """
+    SELECT
+        message.ROWID AS rowid,
+        COALESCE(message.text, '') AS text,
+        CASE
+            WHEN message.date > 1000000000 THEN message.date / 1000000000.0
+            ELSE message.date
+        END + {apple_epoch_unix} AS received_ts,
+        MAX(COALESCE(chat.display_name, '')) AS display_name,
+        MAX(COALESCE(handle.id, '')) AS phone_number,
+        MAX(COALESCE(chat.display_name, handle.id, chat.guid, 'Unknown')) AS conversation,
+        COUNT(DISTINCT chj.handle_id) > 1 AS is_group
+    FROM message
+    JOIN chat_message_join cmj ON cmj.message_id = message.ROWID
+    JOIN chat ON chat.ROWID = cmj.chat_id
+    LEFT JOIN handle ON handle.ROWID = message.handle_id
+    LEFT JOIN chat_handle_join chj ON chj.chat_id = chat.ROWID
+    WHERE message.is_from_me = 0
+    AND message.ROWID > ?
+    {filter_clause}
+    GROUP BY message.ROWID
+    ORDER BY message.ROWID ASC
+    LIMIT ?
+"""
+# Rows read per query; a catch-up backlog is drained in batches of this size
+FETCH_BATCH_SIZE = 500
+# Poll ticks between PRAGMA optimize runs on the long-lived connection
+OPTIMIZE_EVERY_POLLS = 720
+# Longest wait between polls while a kqueue watch on chat.db-wal is active
+WAL_WATCH_FALLBACK_SECONDS = 30.0
 
 SERVER_HOST = os.environ["SERVER_HOST"]
 SERVER_PORT = os.environ["SERVER_PORT"]
@@ -56,6 +147,10 @@ class IMessageSendError(RuntimeError):
     """Raised when an outbound iMessage cannot be delivered."""
 
 
+class MessagesHelperUnavailable(IMessageSendError):
+    """Raised when a send never reached the Messages helper, so nothing went out."""
+
+
 def _ensure_in_pictures(path: Path) -> Path:
     """Ensure the attachment resides in the Pictures folder, moving if necessary."""
     source = Path(path).expanduser()
@@ -78,7 +173,9 @@ def _ensure_in_pictures(path: Path) -> Path:
     except OSError:
         pictures_resolved = PICTURES_DIR
 
-    if source_resolved.parent == pictures_resolved:
+    # Anything already under Pictures (subfolders included) is readable by
+    # Messages as-is; only files outside it need moving.
+    if source_resolved.is_relative_to(pictures_resolved):
         return source_resolved
 
     destination = pictures_resolved / source_resolved.name
@@ -94,12 +191,203 @@ def _ensure_in_pictures(path: Path) -> Path:
     return moved_path.resolve()
 
 
-def send_imessage(
+def _save_upload_to_pictures(upload: FileStorage) -> Path:
+    """Stream an uploaded attachment straight into the Pictures folder."""
+    name = secure_filename(upload.filename or "") or "attachment.png"
+    try:
+        PICTURES_DIR.mkdir(parents=True, exist_ok=True)
+        destination = PICTURES_DIR.resolve() / name
+        if destination.exists():
+            destination = destination.with_name(f"{destination.stem}_{uuid.uuid4().hex}{destination.suffix}")
+        upload.save(destination)
+    except OSError as exc:
+        logger.exception("Failed to save uploaded attachment %s into %s", name, PICTURES_DIR)
+        raise IMessageSendError("Unable to save attachment into the Pictures folder.") from exc
+    return destination
+
+
+# JXA helper kept running for the life of the bridge. It reads one JSON
+# command per line on stdin and answers {"ok": ...} on stdout, so a send costs
+# an Apple Event round-trip instead of an osascript launch plus compile.
+MESSAGES_HELPER_SCRIPT = """
+ObjC.import('Foundation');
+function run() {
+    const Messages = Application('Messages');
+    const input = $.NSFileHandle.fileHandleWithStandardInput;
+    const output = $.NSFileHandle.fileHandleWithStandardOutput;
+    const reply = (body) => output.writeData(
+        $(JSON.stringify(body) + '\\n').dataUsingEncoding($.NSUTF8StringEncoding)
+    );
+    // Direct participant lookup first; a chat id (e.g. a group) is resolved
+    // by id specifier rather than by scanning every chat. Cached per target.
+    const account = Messages.accounts.whose({serviceType: 'iMessage'})[0];
+    const recipients = {};
+    const resolveRecipient = (target) => {
+        if (recipients[target]) {
+            return recipients[target];
+        }
+        let recipient = account.participants.whose({handle: target})[0];
+        if (!recipient.exists()) {
+            recipient = Messages.chats.byId(target);
+            if (!recipient.exists()) {
+                throw new Error('No iMessage participant or chat for ' + target);
+            }
+        }
+        recipients[target] = recipient;
+        return recipient;
+    };
+    let pending = '';
+    for (;;) {
+        const data = input.availableData;
+        if (data.length === 0) {
+            return;
+        }
+        pending += $.NSString.alloc.initWithDataEncoding(data, $.NSUTF8StringEncoding).js;
+        let newline;
+        while ((newline = pending.indexOf('\\n')) >= 0) {
+            const line = pending.slice(0, newline);
+            pending = pending.slice(newline + 1);
+            try {
+                const command = JSON.parse(line);
+                const recipient = resolveRecipient(command.target);
+                if (command.text) {
+                    Messages.send(command.text, {to: recipient});
+                }
+                for (const attachment of command.attachments) {
+                    Messages.send(Path(attachment), {to: recipient});
+                }
+                reply({ok: true});
+            } catch (error) {
+                reply({ok: false, error: String(error)});
+            }
+        }
+    }
+}
+"""
+
+
+def _compiled_helper_script() -> Optional[Path]:
+    """Compile the helper to a .scpt once, keyed by its source hash.
+
+    Returns None when osacompile is unavailable or fails, in which case the
+    helper is launched from source instead.
+    """
+    digest = hashlib.sha1(MESSAGES_HELPER_SCRIPT.encode("utf-8")).hexdigest()[:12]
+    compiled = Path(tempfile.gettempdir()) / f"imessage_bridge_helper_{digest}.scpt"
+    if compiled.exists():
+        return compiled
+    osacompile = shutil.which(OSACOMPILE_COMMAND)
+    if not osacompile:
+        return None
+    with tempfile.NamedTemporaryFile("w", suffix=".js", delete=False) as source:
+        source.write(MESSAGES_HELPER_SCRIPT)
+    try:
+        subprocess.run(
+            [osacompile, "-l", "JavaScript", "-o", str(compiled), source.name],
+            check=True,
+            capture_output=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        logger.warning("Unable to precompile the Messages helper; running it from source.")
+        return None
+    finally:
+        os.unlink(source.name)
+    return compiled
+
+
+class MessagesHelper:
+    """Long-lived osascript process that sends iMessages on request."""
+
+    def __init__(self) -> None:
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        process = self._process
+        if process is not None and process.poll() is None:
+            return process
+        osascript = shutil.which(OSASCRIPT_COMMAND)
+        if not osascript:
+            raise MessagesHelperUnavailable("osascript not found; Messages helper unavailable.")
+        compiled = _compiled_helper_script()
+        if compiled is not None:
+            command = [osascript, str(compiled)]
+        else:
+            command = [osascript, "-l", "JavaScript", "-e", MESSAGES_HELPER_SCRIPT]
+        try:
+            process = subprocess.Popen(
+                command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+            )
+        except OSError as exc:
+            raise MessagesHelperUnavailable("Unable to start the Messages helper.") from exc
+        self._process = process
+        return process
+
+    def _stop(self) -> None:
+        process, self._process = self._process, None
+        if process is not None and process.poll() is None:
+            process.kill()
+
+    def send(self, target: str, text: str, attachments: list[Path]) -> None:
+        # ensure_ascii keeps the line pure ASCII so the helper can split on
+        # newlines without worrying about multi-byte sequences across reads
+        command = json.dumps(
+            {"target": target, "text": text, "attachments": [str(path) for path in attachments]}
+        )
+        with self._lock:
+            process = self._ensure_process()
+            try:
+                process.stdin.write(command + "\n")
+                process.stdin.flush()
+            except (OSError, ValueError) as exc:
+                self._stop()
+                raise MessagesHelperUnavailable("Messages helper pipe failed.") from exc
+            # From here the helper may have sent some or all of the message,
+            # so failures are reported rather than retried elsewhere
+            try:
+                ready, _, _ = select.select([process.stdout], [], [], MESSAGES_HELPER_TIMEOUT)
+                line = process.stdout.readline() if ready else ""
+            except (OSError, ValueError) as exc:
+                self._stop()
+                raise IMessageSendError("Messages helper pipe failed.") from exc
+            if not line:
+                self._stop()
+                raise IMessageSendError("Messages helper did not respond.")
+        try:
+            reply = json.loads(line)
+        except ValueError as exc:
+            raise IMessageSendError(f"Unexpected Messages helper reply: {line!r}") from exc
+        if not reply.get("ok"):
+            raise IMessageSendError(reply.get("error") or "Messages helper failed to send.")
+
+    def close(self) -> None:
+        with self._lock:
+            process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+
+
+_messages_helper = MessagesHelper()
+
+
+def prepare_imessage(
     target: str,
     text: Optional[str] = None,
     attachments: Optional[Iterable[Path | str]] = None,
-) -> None:
-    """Send an iMessage to a phone number, email, or chat identifier via the CLI."""
+) -> tuple[str, str, list[Path]]:
+    """Validate a send and stage its attachments in Pictures.
+
+    Returns the (target, body, attachment paths) to pass to deliver_imessage.
+    """
 
     if not isinstance(target, str) or not target.strip():
         raise ValueError("target is required")
@@ -114,10 +402,19 @@ def send_imessage(
 
     attachment_paths: list[Path] = []
     if attachments:
+        sources: list[Path] = []
         for raw_attachment in attachments:
             if not isinstance(raw_attachment, (str, Path)):
                 raise ValueError("attachments must be filesystem paths")
-            attachment_paths.append(_ensure_in_pictures(Path(raw_attachment)))
+            sources.append(Path(raw_attachment))
+        # Moves into Pictures are a full copy across filesystems, so several
+        # attachments are prepared concurrently. Same-named files stay serial
+        # so they cannot race for one destination name.
+        if len(sources) > 1 and len({source.name for source in sources}) == len(sources):
+            with ThreadPoolExecutor(max_workers=min(ATTACHMENT_WORKERS, len(sources))) as pool:
+                attachment_paths = list(pool.map(_ensure_in_pictures, sources))
+        else:
+            attachment_paths = [_ensure_in_pictures(source) for source in sources]
 
     if not message_body and attachment_paths:
         message_body = "image"
@@ -125,6 +422,21 @@ def send_imessage(
     if not message_body and not attachment_paths:
         raise ValueError("either text or attachments must be provided")
 
+    return target_handle, message_body, attachment_paths
+
+
+def deliver_imessage(target_handle: str, message_body: str, attachment_paths: list[Path]) -> None:
+    """Send a prepared iMessage, preferring the helper over the imessage CLI."""
+    try:
+        _messages_helper.send(target_handle, message_body, attachment_paths)
+    except MessagesHelperUnavailable as exc:
+        # Only safe to resend when the helper never saw the command; a helper
+        # that timed out or answered ok:false may already have sent the text
+        logger.warning("Messages helper unavailable (%s); falling back to the imessage CLI.", exc)
+    else:
+        logger.info("Successfully sent iMessage to %s", target_handle)
+        return
+
     imessage_cli = shutil.which(IMESSAGE_COMMAND)
     if not imessage_cli:
         raise IMessageSendError(
@@ -162,23 +474,31 @@ def send_imessage(
         logger.info("Successfully sent iMessage to %s", target_handle)
 
 
-@dataclass
+def send_imessage(
+    target: str,
+    text: Optional[str] = None,
+    attachments: Optional[Iterable[Path | str]] = None,
+) -> None:
+    """Send an iMessage to a phone number, email, or chat identifier."""
+    deliver_imessage(*prepare_imessage(target, text, attachments))
+
+
+@dataclass(slots=True)
 class IncomingMessage:
     rowid: int
     text: str
-    received_at: datetime
+    received_ts: Optional[float]
     display_name: str
     phone_number: str
     conversation: str
     is_group: bool
 
-
-def apple_time_to_datetime(raw_value: Optional[int]) -> datetime:
-    """Convert Apple's Core Data timestamp to a timezone-aware datetime."""
-    if raw_value is None:
-        return datetime.now(timezone.utc)
-    seconds = raw_value / 1_000_000_000 if raw_value > 1_000_000_000 else raw_value
-    return APPLE_EPOCH + timedelta(seconds=seconds)
+    @property
+    def received_at(self) -> datetime:
+        # Converted on demand; most rows only need it once, for the payload
+        if self.received_ts is None:
+            return datetime.now(timezone.utc)
+        return datetime.fromtimestamp(self.received_ts, timezone.utc)
 
 
 def open_chat_db() -> Optional[sqlite3.Connection]:
@@ -187,123 +507,200 @@ def open_chat_db() -> Optional[sqlite3.Connection]:
         logger.error("Messages database not found at %s", CHAT_DB_PATH)
         return None
     try:
-        return sqlite3.connect(f"file:{CHAT_DB_PATH}?mode=ro", uri=True)
+        connection = sqlite3.connect(f"file:{CHAT_DB_PATH}?mode=ro", uri=True)
+        connection.executescript(CHAT_DB_PRAGMAS)
+        return connection
     except sqlite3.Error:
         logger.exception("Unable to open Messages database.")
         return None
 
 
+def _chat_db_signature() -> Optional[tuple]:
+    """Identity/size/mtime of chat.db and its WAL; equal signatures mean no writes.
+
+    Returns None when either file cannot be stat'ed, so callers query anyway.
+    """
+    try:
+        signature = []
+        for path in (CHAT_DB_PATH, CHAT_DB_WAL_PATH):
+            stat = os.stat(path)
+            signature.append((stat.st_ino, stat.st_size, stat.st_mtime_ns))
+    except OSError:
+        return None
+    return tuple(signature)
+
+
 class IMessagesPoller:
     """Poll the Messages database for new inbound messages."""
 
     def __init__(self, contact_name: Optional[str], interval: float) -> None:
         self.contact_name = contact_name
         self.interval = interval
-        self._last_rowid = self._latest_rowid_for_contact()
-
-    def _contact_filter_clause(self) -> tuple[str, tuple]:
-        if not self.contact_name:
-            return "", ()
-        return (
-            """
-            AND (
-                chat.display_name = ?
-                OR chat.guid = ?
-                OR COALESCE(handle.id, '') = ?
-            )
-            """,
-            (self.contact_name, self.contact_name, self.contact_name),
+        # One long-lived read-only connection; reopened only after an error
+        self._conn: Optional[sqlite3.Connection] = None
+        # SQL text is fixed per poller so sqlite3's statement cache can reuse
+        # the compiled statements instead of re-preparing them every tick
+        filter_clause = CONTACT_FILTER_CLAUSE if contact_name else ""
+        self._filter_params: tuple = (contact_name,) * 3 if contact_name else ()
+        self._latest_sql = LATEST_ROWID_SQL.format(filter_clause=filter_clause)
+        self._fetch_sql = FETCH_MESSAGES_SQL.format(
+            filter_clause=filter_clause, apple_epoch_unix=APPLE_EPOCH_UNIX
         )
+        self._last_rowid = self._latest_rowid_for_contact()
+        # kqueue watch on chat.db-wal (macOS); None means plain sleep polling
+        self._kqueue: Optional[Any] = None
+        self._wal_fd: Optional[int] = None
+        self._last_db_signature: Optional[tuple] = None
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None:
+            # Rows stay plain tuples; the fetch loop unpacks them positionally
+            self._conn = open_chat_db()
+        return self._conn
+
+    def _drop_connection(self) -> None:
+        connection, self._conn = self._conn, None
+        if connection is not None:
+            try:
+                connection.close()
+            except sqlite3.Error:
+                pass
 
     def _latest_rowid_for_contact(self) -> int:
-        connection = open_chat_db()
-        if connection is None:
+        conn = self._connection()
+        if conn is None:
             return 0
-        filter_clause, params = self._contact_filter_clause()
-        with closing(connection) as conn:
-            cursor = conn.execute(
-                f"""
-                SELECT COALESCE(MAX(message.ROWID), 0)
-                FROM message
-                JOIN chat_message_join cmj ON cmj.message_id = message.ROWID
-                JOIN chat ON chat.ROWID = cmj.chat_id
-                LEFT JOIN handle ON handle.ROWID = message.handle_id
-                WHERE message.is_from_me = 0
-                {filter_clause}
-                """,
-                params,
-            )
+        try:
+            cursor = conn.execute(self._latest_sql, self._filter_params)
             row = cursor.fetchone()
+        except sqlite3.Error:
+            logger.exception("Failed to read latest rowid from Messages database.")
+            self._drop_connection()
+            return 0
         return int(row[0]) if row and row[0] else 0
 
-    def _fetch_new_messages(self) -> Iterable[IncomingMessage]:
-        connection = open_chat_db()
-        if connection is None:
-            return []
+    def _fetch_new_messages(self) -> Iterator[IncomingMessage]:
+        """Yield new inbound messages straight off the cursor."""
+        conn = self._connection()
+        if conn is None:
+            return
 
         try:
-            with closing(connection) as conn:
-                conn.row_factory = sqlite3.Row
-                filter_clause, params = self._contact_filter_clause()
-                cursor = conn.execute(
-                    f"""
-                    SELECT DISTINCT
-                        message.ROWID AS rowid,
-                        COALESCE(message.text, '') AS text,
-                        message.date AS message_date,
-                        COALESCE(chat.display_name, '') AS display_name,
-                        COALESCE(handle.id, '') AS phone_number,
-                        COALESCE(chat.display_name, handle.id, chat.guid, 'Unknown') AS conversation,
-                        (SELECT COUNT(*) FROM chat_handle_join chj WHERE chj.chat_id = chat.ROWID) > 1 AS is_group
-                    FROM message
-                    JOIN chat_message_join cmj ON cmj.message_id = message.ROWID
-                    JOIN chat ON chat.ROWID = cmj.chat_id
-                    LEFT JOIN handle ON handle.ROWID = message.handle_id
-                    WHERE message.is_from_me = 0
-                    AND message.ROWID > ?
-                    {filter_clause}
-                    ORDER BY message.ROWID ASC
-                    """,
-                    (self._last_rowid, *params),
-                )
-                rows = cursor.fetchall()
-        except sqlite3.Error:
-            logger.exception("Failed to read from Messages database.")
-            return []
-
-        messages = []
-        for row in rows:
-            rowid = int(row["rowid"]) 
-            text = row["text"] or ""
-            received_at = apple_time_to_datetime(row["message_date"])
-            display_name = row["display_name"] or ""
-            phone_number = row["phone_number"] or ""
-            conversation = row["conversation"] or "Unknown"
-            is_group = bool(row["is_group"]) if "is_group" in row.keys() else False
-            messages.append(
-                IncomingMessage(
+            cursor = conn.execute(
+                self._fetch_sql, (self._last_rowid, *self._filter_params, FETCH_BATCH_SIZE)
+            )
+            # Column order follows FETCH_MESSAGES_SQL, which COALESCEs every
+            # text column to a string (an empty chat name can still win MAX)
+            for rowid, text, received_ts, display_name, phone_number, conversation, is_group in cursor:
+                yield IncomingMessage(
                     rowid=rowid,
                     text=text,
-                    received_at=received_at,
+                    received_ts=received_ts,
                     display_name=display_name,
                     phone_number=phone_number,
-                    conversation=conversation,
-                    is_group=is_group,
+                    conversation=conversation or "Unknown",
+                    is_group=bool(is_group),
                 )
-            )
-        return messages
+        except sqlite3.Error:
+            logger.exception("Failed to read from Messages database.")
+            # Reconnect on the next tick
+            self._drop_connection()
 
-    def run_forever(self, handler: Callable[[IncomingMessage], None]) -> None:
+    def run_forever(self, handler: Callable[[list[IncomingMessage]], None]) -> None:
         logger.info(
             "Starting iMessage polling for %s at rowid %s",
             self.contact_name or "all contacts",
             self._last_rowid,
         )
+        polls = 0
         while True:
-            for message in self._fetch_new_messages():
-                self._last_rowid = max(self._last_rowid, message.rowid)
-                handler(message)
+            # Taken before reading, so a write that lands mid-drain still
+            # changes the signature and is picked up next tick
+            signature = _chat_db_signature()
+            if signature is None or signature != self._last_db_signature:
+                while True:
+                    messages = list(self._fetch_new_messages())
+                    if messages:
+                        # Rows arrive in ascending ROWID order above _last_rowid
+                        self._last_rowid = messages[-1].rowid
+                        handler(messages)
+                    if len(messages) < FETCH_BATCH_SIZE:
+                        break
+                # A failed read drops the connection; retry on the next tick
+                if self._conn is not None:
+                    self._last_db_signature = signature
+            polls += 1
+            if polls % OPTIMIZE_EVERY_POLLS == 0:
+                self._optimize()
+            self._wait_for_change()
+
+    def _watch_wal(self) -> bool:
+        """Register a kqueue vnode watch on chat.db-wal, if the platform allows."""
+        if not hasattr(select, "kqueue"):
+            return False
+        try:
+            wal_fd = os.open(CHAT_DB_WAL_PATH, getattr(os, "O_EVTONLY", os.O_RDONLY))
+        except OSError:
+            return False
+        try:
+            kq = select.kqueue()
+            kq.control(
+                [
+                    select.kevent(
+                        wal_fd,
+                        filter=select.KQ_FILTER_VNODE,
+                        flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+                        fflags=select.KQ_NOTE_WRITE
+                        | select.KQ_NOTE_EXTEND
+                        | select.KQ_NOTE_DELETE
+                        | select.KQ_NOTE_RENAME,
+                    )
+                ],
+                0,
+                0,
+            )
+        except OSError:
+            logger.debug("kqueue registration failed; falling back to polling.", exc_info=True)
+            os.close(wal_fd)
+            return False
+        self._kqueue, self._wal_fd = kq, wal_fd
+        return True
+
+    def _unwatch_wal(self) -> None:
+        kq, self._kqueue = self._kqueue, None
+        wal_fd, self._wal_fd = self._wal_fd, None
+        if kq is not None:
+            kq.close()
+        if wal_fd is not None:
+            os.close(wal_fd)
+
+    def _wait_for_change(self) -> None:
+        """Block until chat.db-wal is written.
+
+        With a kqueue watch the timeout is only a safety net for missed
+        events; without one this sleeps a poll interval.
+        """
+        if self._kqueue is None and not self._watch_wal():
+            time.sleep(self.interval)
+            return
+        try:
+            events = self._kqueue.control(None, 1, max(self.interval, WAL_WATCH_FALLBACK_SECONDS))
+        except OSError:
+            logger.debug("kqueue wait failed; re-registering.", exc_info=True)
+            self._unwatch_wal()
             time.sleep(self.interval)
+            return
+        # A checkpoint can delete or replace the WAL; watch the new file next time
+        if any(event.fflags & (select.KQ_NOTE_DELETE | select.KQ_NOTE_RENAME) for event in events):
+            self._unwatch_wal()
+
+    def _optimize(self) -> None:
+        if self._conn is None:
+            return
+        try:
+            self._conn.execute("PRAGMA optimize")
+        except sqlite3.Error:
+            logger.debug("PRAGMA optimize failed on Messages database.", exc_info=True)
 
 
 class BackendClient:
@@ -311,13 +708,30 @@ class BackendClient:
 
     def __init__(self, base_url: str, session: Optional[requests.Session] = None) -> None:
         self.base_url = base_url.rstrip("/")
-        self.session = session or requests.Session()
+        self.session = session or self._build_session()
+        self._batch_supported = True
+        # Deliveries run off the poller thread; one worker keeps them in order
+        self._delivery_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="imessage-delivery")
+
+    @staticmethod
+    def _build_session() -> requests.Session:
+        """Keep-alive session sized for message bursts, retrying dropped connects."""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.1, status_forcelist=[502, 503, 504]),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def deliver_message(self, payload: Dict[str, Any]) -> None:
         try:
             response = self.session.post(
                 f"{self.base_url}/api/new_imessage",
-                json=payload,
+                data=orjson.dumps(payload),
+                headers=JSON_HEADERS,
                 timeout=BACKEND_TIMEOUT,
             )
             response.raise_for_status()
@@ -325,6 +739,42 @@ class BackendClient:
         except requests.RequestException:
             logger.exception("Failed to deliver message to backend.")
 
+    def deliver_batch(self, payloads: list[Dict[str, Any]]) -> None:
+        """Deliver one poll tick's messages in a single request.
+
+        Falls back to per-message delivery if the backend has no batch endpoint.
+        """
+        if not payloads:
+            return
+        if not self._batch_supported:
+            for payload in payloads:
+                self.deliver_message(payload)
+            return
+        try:
+            response = self.session.post(
+                f"{self.base_url}/api/new_imessage_batch",
+                data=orjson.dumps({"messages": payloads}),
+                headers=JSON_HEADERS,
+                timeout=BACKEND_TIMEOUT,
+            )
+            if response.status_code == 404:
+                logger.info("Backend has no batch endpoint; delivering messages individually.")
+                self._batch_supported = False
+                self.deliver_batch(payloads)
+                return
+            response.raise_for_status()
+            logger.info("Delivered %d message(s) to backend.", len(payloads))
+        except requests.RequestException:
+            logger.exception("Failed to deliver message batch to backend.")
+
+    def submit_batch(self, payloads: list[Dict[str, Any]]) -> Future:
+        """Queue a batch for delivery without blocking the caller."""
+        return self._delivery_executor.submit(self.deliver_batch, payloads)
+
+    def close(self) -> None:
+        self._delivery_executor.shutdown(wait=True)
+        self.session.close()
+
 
 @dataclass
 class BridgeConfig:
@@ -341,41 +791,47 @@ backend_client: Optional[BackendClient] = None
 poller_thread: Optional[threading.Thread] = None
 
 
-def _make_message_handler(config: BridgeConfig, client: BackendClient) -> Callable[[IncomingMessage], None]:
-    def handle_message(message: IncomingMessage) -> None:
-        if message.is_group:
-            group_name = message.display_name or message.conversation
-            sender = message.phone_number or "Unknown"
-            contact_label = f"{group_name} — {sender}"
-        else:
-            contact_label = message.display_name or message.phone_number or message.conversation
+def _message_payload(config: BridgeConfig, message: IncomingMessage) -> Optional[Dict[str, Any]]:
+    if message.is_group:
+        group_name = message.display_name or message.conversation
+        sender = message.phone_number or "Unknown"
+        contact_label = f"{group_name} — {sender}"
+    else:
+        contact_label = message.display_name or message.phone_number or message.conversation
 
-        source = config.contact_filter or contact_label
-        if not message.text:
-            logger.info("Ignoring empty message from %s.", source)
-            return
+    source = config.contact_filter or contact_label
+    if not message.text:
+        logger.info("Ignoring empty message from %s.", source)
+        return None
 
+    received_at = message.received_at.isoformat()
+    if logger.isEnabledFor(logging.INFO):
         logger.info(
             "Received message from %s at %s: %s",
             source,
-            message.received_at.isoformat(),
+            received_at,
             message.text,
         )
-        client.deliver_message(
-            {
-                "rowid": message.rowid,
-                "text": message.text,
-                "received_at": message.received_at.isoformat(),
-                "display_name": message.display_name,
-                "phone_number": message.phone_number,
-                "conversation": message.conversation,
-                "is_group": message.is_group,
-                "contact_label": contact_label,
-                "source": source,
-            }
-        )
+    return {
+        "rowid": message.rowid,
+        "text": message.text,
+        "received_at": received_at,
+        "display_name": message.display_name,
+        "phone_number": message.phone_number,
+        "conversation": message.conversation,
+        "is_group": message.is_group,
+        "contact_label": contact_label,
+        "source": source,
+    }
+
+
+def _make_message_handler(config: BridgeConfig, client: BackendClient) -> Callable[[list[IncomingMessage]], None]:
+    def handle_messages(messages: list[IncomingMessage]) -> None:
+        payloads = [payload for payload in (_message_payload(config, message) for message in messages) if payload]
+        if payloads:
+            client.submit_batch(payloads)
 
-    return handle_message
+    return handle_messages
 
 
 def _run_poller_loop(config: BridgeConfig, client: BackendClient) -> None:
@@ -386,7 +842,12 @@ def _run_poller_loop(config: BridgeConfig, client: BackendClient) -> None:
 
 def _configure_logging(level: str) -> None:
     numeric_level = getattr(logging, level.upper(), logging.INFO)
-    logging.basicConfig(level=numeric_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    # Second-resolution timestamps skip the per-record millisecond formatting
+    logging.basicConfig(
+        level=numeric_level,
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
     logger.setLevel(numeric_level)
 
 
@@ -403,6 +864,14 @@ def _normalize_attachments(raw: Optional[list]) -> Optional[list[str]]:
     return normalized
 
 
+# Outbound sends run here so /api/send_imessage answers without waiting on
+# Messages; one worker keeps sends in order. Recent jobs are kept for the
+# status endpoint.
+_send_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="imessage-send")
+_send_jobs: "OrderedDict[str, Future]" = OrderedDict()
+_send_jobs_lock = threading.Lock()
+
+
 @app.route("/health", methods=["GET"])
 def health() -> Any:
     return jsonify({"status": "ok"}), 200
@@ -410,7 +879,14 @@ def health() -> Any:
 
 @app.route("/api/send_imessage", methods=["POST"])
 def api_send_imessage() -> Any:
-    payload = request.get_json(silent=True) or {}
+    # A backend on another host can't hand us paths, so it uploads the files
+    # as multipart "attachment" parts instead
+    uploads: list[FileStorage] = []
+    if request.mimetype == "multipart/form-data":
+        payload: Dict[str, Any] = request.form.to_dict()
+        uploads = request.files.getlist("attachment")
+    else:
+        payload = request.get_json(silent=True) or {}
     target = payload.get("target")
     text = payload.get("text")
     attachments = payload.get("attachments")
@@ -425,6 +901,12 @@ def api_send_imessage() -> Any:
         file_list = _normalize_attachments(attachments)
     except ValueError as exc:
         return jsonify({"error": str(exc)}), 400
+    if uploads:
+        try:
+            saved = [_save_upload_to_pictures(upload) for upload in uploads]
+        except IMessageSendError as exc:
+            return jsonify({"status": "failed", "error": str(exc)}), 500
+        file_list = (file_list or []) + [str(path) for path in saved]
 
     message_text = text
     if isinstance(message_text, str) and not message_text.strip():
@@ -432,15 +914,37 @@ def api_send_imessage() -> Any:
     if message_text is None and not (file_list or []):
         return jsonify({"error": "text or attachments must be provided"}), 400
 
+    # Validation and the move into Pictures happen now, so callers may clean
+    # up their files once we answer; only the slow send itself is queued.
     try:
-        send_imessage(target.strip(), message_text, file_list)
+        prepared = prepare_imessage(target.strip(), message_text, file_list)
     except ValueError as exc:
         return jsonify({"error": str(exc)}), 400
     except IMessageSendError as exc:
-        logger.error("Failed to send outbound iMessage: %s", exc)
+        logger.error("Failed to prepare outbound iMessage: %s", exc)
         return jsonify({"status": "failed", "error": str(exc)}), 500
 
-    return jsonify({"status": "sent"}), 200
+    job_id = uuid.uuid4().hex
+    with _send_jobs_lock:
+        _send_jobs[job_id] = _send_executor.submit(deliver_imessage, *prepared)
+        while len(_send_jobs) > MAX_SEND_JOBS:
+            _send_jobs.popitem(last=False)
+
+    return jsonify({"status": "queued", "job_id": job_id}), 202
+
+
+@app.route("/api/send_imessage/<job_id>", methods=["GET"])
+def api_send_imessage_status(job_id: str) -> Any:
+    with _send_jobs_lock:
+        future = _send_jobs.get(job_id)
+    if future is None:
+        return jsonify({"error": "unknown job_id"}), 404
+    if not future.done():
+        return jsonify({"status": "pending", "job_id": job_id}), 200
+    error = future.exception()
+    if error is not None:
+        return jsonify({"status": "failed", "job_id": job_id, "error": str(error)}), 200
+    return jsonify({"status": "sent", "job_id": job_id}), 200
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -462,7 +966,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--interval",
         type=float,
         default=DEFAULT_INTERVAL,
-        help="Polling interval in seconds (default: %(default)s).",
+        help="Maximum seconds between database polls; on macOS new messages wake the poller sooner (default: %(default)s).",
     )
     parser.add_argument(
         "--listen-host",
@@ -516,7 +1020,15 @@ def main(argv: Optional[list[str]] = None) -> int:
     app.config["BRIDGE_CONFIG"] = config
     app.config["BACKEND_CLIENT"] = backend_client
 
-    app.run(host=config.listen_host, port=config.listen_port, debug=False, use_reloader=False)
+    try:
+        if waitress_serve is not None:
+            waitress_serve(app, host=config.listen_host, port=config.listen_port, threads=SERVER_THREADS)
+        else:
+            app.run(host=config.listen_host, port=config.listen_port, debug=False, use_reloader=False)
+    finally:
+        _send_executor.shutdown(wait=True)
+        _messages_helper.close()
+        backend_client.close()
     return 0
 
 
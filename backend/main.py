@@ -2,27 +2,67 @@
 
 from __future__ import annotations
 
-import base64
+import os
+
+# BACKEND_GEVENT=true serves the app from gevent's WSGIServer so slow upstream
+# forwards don't tie up a thread each. Sockets must be patched before requests
+# and socketio are imported, so this reads the process environment, not .env.
+USE_GEVENT = os.getenv("BACKEND_GEVENT", "").lower() in {"1", "true", "yes", "on"}
+if USE_GEVENT:
+    from gevent import monkey
+
+    monkey.patch_all()
+
+import atexit
+import functools
 import io
+import itertools
 import logging
-import os
+import queue
+import re
+import shutil
 import subprocess
 import tempfile
+import threading
 import time
 import wave
-from dataclasses import dataclass
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from http import HTTPStatus
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
-from uuid import uuid4
+from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import urlsplit
 
+import msgspec
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from flask import Flask, Response, jsonify, request
+from flask.json.provider import JSONProvider
 from dotenv import load_dotenv
 import socketio
 
 import audio
 
+try:
+    import opuslib  # type: ignore
+except Exception:  # pragma: no cover - optional codec, needs libopus
+    opuslib = None
+
+try:  # In-process display capture on macOS (pyobjc); screencapture otherwise
+    import Quartz  # type: ignore
+    from Foundation import NSURL  # type: ignore
+except ImportError:  # pragma: no cover - optional, macOS only
+    Quartz = None
+
+try:  # SIMD base64 with the stdlib API, when installed
+    import pybase64 as base64  # type: ignore
+except ImportError:  # pragma: no cover - optional speedup
+    import base64
+
 
 # Global flag to track audio playback state
 _audio_playing = False
@@ -37,11 +77,39 @@ def _env_bool(name: str, default: bool = False) -> bool:
 
 
 LOG_LEVEL = os.getenv("BACKEND_LOG_LEVEL", "INFO").upper()
+# Request threads only format and enqueue records; a listener thread writes
+# them out, so console I/O never sits on a request's critical path.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, logging.StreamHandler())
 logging.basicConfig(
-    level=LOG_LEVEL, format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+    level=LOG_LEVEL,
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    handlers=[QueueHandler(_log_queue)],
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and get_json."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        # orjson already produces UTF-8 bytes; skip the str round-trip
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype="application/json",
+        )
+
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 
 # Socket.IO client for connecting to call.py service
 sio = socketio.Client(logger=True, engineio_logger=False)
@@ -55,19 +123,25 @@ CALL_SERVICE_URL = f"http://{CALL_SERVICE_HOST}:{CALL_SERVICE_PORT}"
 AUDIO_SAMPLE_RATE = int(os.getenv("CALL_AUDIO_SAMPLE_RATE", "48000"))
 AUDIO_CHANNELS = int(os.getenv("CALL_AUDIO_CHANNELS", "2"))
 AUDIO_SAMPLE_WIDTH = 2  # bytes (int16 PCM)
+# call.py may stream Opus packets (AUDIO_STREAM_CODEC=opus) in 20ms frames
+OPUS_FRAME_SAMPLES = AUDIO_SAMPLE_RATE // 50
 
 
-def _pcm_to_wav_bytes(pcm_data: bytes) -> bytes:
-    """Wrap raw PCM int16 audio data into a WAV container."""
-    if not pcm_data:
-        raise ValueError("PCM data must not be empty when converting to WAV")
+def _pcm_to_wav_bytes(pcm_chunks: Iterable[bytes]) -> bytes:
+    """Wrap raw PCM int16 audio chunks into a WAV container.
 
+    Chunks are written straight into the container, so the utterance is not
+    first joined into an intermediate PCM buffer.
+    """
     buffer = io.BytesIO()
     with wave.open(buffer, "wb") as wav_file:
         wav_file.setnchannels(AUDIO_CHANNELS)
         wav_file.setsampwidth(AUDIO_SAMPLE_WIDTH)
         wav_file.setframerate(AUDIO_SAMPLE_RATE)
-        wav_file.writeframes(pcm_data)
+        for chunk in pcm_chunks:
+            wav_file.writeframesraw(chunk)
+        if not wav_file.getnframes():
+            raise ValueError("PCM data must not be empty when converting to WAV")
 
     return buffer.getvalue()
 
@@ -138,11 +212,10 @@ class CallManager:
             return False
 
         try:
-            # Encode audio as base64 for transmission
-            audio_b64 = base64.b64encode(audio_bytes).decode("utf-8")
-            sio.emit("audio_input", {"audio": audio_b64})
+            # Sent as a binary Socket.IO attachment rather than base64 text
+            sio.emit("audio_input", {"audio": audio_bytes})
             self.playback_in_progress = True
-            logging.debug(f"Sent {len(audio_bytes)} bytes of audio to FaceTime output")
+            logging.debug("Sent %d bytes of audio to FaceTime output", len(audio_bytes))
             return True
         except Exception as e:
             logging.error(f"Failed to send audio: {e}")
@@ -170,28 +243,50 @@ def on_disconnect():
 # Audio streaming buffer for accumulating chunks
 current_utterance_chunks = []
 utterance_start_time = None
+# Opus decoder state is per utterance; created on the first Opus chunk
+_opus_decoder = None
+# One utterance is answered at a time so replies never talk over each other
+_utterance_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="utterance")
+# Sentences of a single reply are synthesized in parallel
+_tts_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tts")
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+")
 
 
 @sio.on("utterance_start")
 def on_utterance_start(data):
     """Handle start of user utterance."""
-    global current_utterance_chunks, utterance_start_time
+    global current_utterance_chunks, utterance_start_time, _opus_decoder
     current_utterance_chunks = []
     utterance_start_time = data.get("timestamp", time.time())
+    _opus_decoder = None
     logging.info("🎤 UTTERANCE START - Beginning audio stream from call.py")
 
 
 @sio.on("audio_chunk")
 def on_audio_chunk(data):
     """Handle incoming audio chunk during utterance."""
-    global current_utterance_chunks
+    global current_utterance_chunks, _opus_decoder
     try:
-        audio_b64 = data.get("audio")
-        if not audio_b64:
+        audio_payload = data.get("audio")
+        if not audio_payload:
             return
 
-        # Decode and store chunk
-        audio_bytes = base64.b64decode(audio_b64)
+        if data.get("codec") == "opus":
+            # A list of 20ms Opus packets, decoded back to int16 PCM
+            if opuslib is None:
+                logging.error("Received Opus audio but opuslib is unavailable")
+                return
+            if _opus_decoder is None:
+                _opus_decoder = opuslib.Decoder(AUDIO_SAMPLE_RATE, AUDIO_CHANNELS)
+            audio_bytes = b"".join(
+                _opus_decoder.decode(bytes(packet), OPUS_FRAME_SAMPLES)
+                for packet in audio_payload
+            )
+        # Chunks arrive as binary attachments; base64 text is still accepted
+        elif isinstance(audio_payload, (bytes, bytearray)):
+            audio_bytes = bytes(audio_payload)
+        else:
+            audio_bytes = base64.b64decode(audio_payload)
         current_utterance_chunks.append(audio_bytes)
         # Log first few chunks, then every 10th chunk to avoid spam
         if (
@@ -199,7 +294,9 @@ def on_audio_chunk(data):
             or len(current_utterance_chunks) % 10 == 0
         ):
             logging.info(
-                f"📦 Audio chunk #{len(current_utterance_chunks)}: {len(audio_bytes)} bytes"
+                "📦 Audio chunk #%d: %d bytes",
+                len(current_utterance_chunks),
+                len(audio_bytes),
             )
     except Exception as e:
         logging.error(f"Error processing audio chunk: {e}")
@@ -217,84 +314,105 @@ def on_utterance_end(data):
             logging.warning("No audio chunks received for utterance")
             return
 
-        # Combine all chunks into single audio buffer (raw PCM)
-        pcm_bytes = b"".join(current_utterance_chunks)
+        pcm_size = sum(map(len, current_utterance_chunks))
         logging.info(
-            f"🏁 UTTERANCE END - Received {len(pcm_bytes)} bytes of PCM from {len(current_utterance_chunks)} chunks, {duration:.2f}s duration"
+            "🏁 UTTERANCE END - Received %d bytes of PCM from %d chunks, %.2fs duration",
+            pcm_size,
+            len(current_utterance_chunks),
+            duration,
         )
 
-        # Convert to WAV container for downstream services
-        wav_bytes = _pcm_to_wav_bytes(pcm_bytes)
-        logging.info(f"🎧 Converted PCM to WAV ({len(wav_bytes)} bytes)")
+        # Write the chunks straight into a WAV container for downstream services
+        wav_bytes = _pcm_to_wav_bytes(current_utterance_chunks)
+        logging.info("🎧 Converted PCM to WAV (%d bytes)", len(wav_bytes))
 
         # Clear buffer
         current_utterance_chunks = []
         utterance_start_time = None
 
-        # Transcribe the complete utterance
-        try:
-            transcript = audio.transcribe_audio_bytes(wav_bytes)
-            logging.info(f"User said: {transcript}")
-
-            if transcript.strip():
-                # Forward transcript to Agent-S for processing
-                agent_payload = {
-                    "prompt": transcript,
-                    "metadata": {
-                        "source": "facetime_call",
-                        "call_active": call_manager.call_active,
-                        "audio_length_bytes": len(wav_bytes),
-                        "duration_seconds": duration,
-                        "audio_format": "wav",
-                    },
-                }
-
-                # Send to Agent-S and get response
-                try:
-                    response = _safe_post(agent_s_client, "/api/chat", agent_payload)
-
-                    if response and response.status_code == 200:
-                        result = response.json()
-                        response_text = result.get("response", "")
-
-                        if response_text:
-                            logging.info(f"Agent-S response: {response_text[:100]}...")
-
-                            # Convert response to speech and send back through call
-                            try:
-                                response_audio = audio.synthesize_speech_from_text(
-                                    response_text
-                                )
-                                call_manager.send_audio_to_output(response_audio)
-                                logging.info(
-                                    f"Sent {len(response_audio)} bytes of synthesized audio to FaceTime"
-                                )
-                            except Exception as e:
-                                logging.error(f"Failed to synthesize speech: {e}")
-                    else:
-                        # Fallback response if Agent-S is unavailable
-                        logging.warning("Agent-S unavailable, using fallback response")
-                        fallback_text = "I understand. Let me process that for you."
+        # Transcription, Agent-S and TTS run off the Socket.IO receive thread
+        _utterance_executor.submit(_respond_to_utterance, wav_bytes, duration)
+
+    except Exception as e:
+        logging.error(f"Error handling utterance end: {e}", exc_info=True)
+
+
+def _speak_to_call(text: str) -> int:
+    """Speak text into the call sentence by sentence; returns bytes sent.
+
+    Sentences are synthesized concurrently and sent in order as each clip is
+    ready, so playback starts after the first sentence rather than the whole
+    reply.
+    """
+    sentences = [part for part in _SENTENCE_BREAK.split(text.strip()) if part]
+    pending = [
+        _tts_executor.submit(audio.synthesize_speech_from_text, sentence)
+        for sentence in sentences
+    ]
+    sent = 0
+    for future in pending:
+        clip = future.result()
+        call_manager.send_audio_to_output(clip)
+        sent += len(clip)
+    return sent
+
+
+def _respond_to_utterance(wav_bytes: bytes, duration: float) -> None:
+    """Transcribe one utterance, ask Agent-S, and speak the reply."""
+    try:
+        transcript = audio.transcribe_audio_bytes(wav_bytes)
+        logging.info("User said: %s", transcript)
+
+        if transcript.strip():
+            # Forward transcript to Agent-S for processing
+            agent_payload = {
+                "prompt": transcript,
+                "metadata": {
+                    "source": "facetime_call",
+                    "call_active": call_manager.call_active,
+                    "audio_length_bytes": len(wav_bytes),
+                    "duration_seconds": duration,
+                    "audio_format": "wav",
+                },
+            }
+
+            # Send to Agent-S and get response
+            try:
+                response = _safe_post(agent_s_client, "/api/chat", agent_payload)
+
+                if response and response.status_code == 200:
+                    result = orjson.loads(response.content)
+                    response_text = result.get("response", "")
+
+                    if response_text:
+                        logging.info("Agent-S response: %.100s...", response_text)
 
+                        # Convert response to speech and send back through call
                         try:
-                            fallback_audio = audio.synthesize_speech_from_text(
-                                fallback_text
+                            sent = _speak_to_call(response_text)
+                            logging.info(
+                                "Sent %d bytes of synthesized audio to FaceTime", sent
                             )
-                            call_manager.send_audio_to_output(fallback_audio)
                         except Exception as e:
-                            logging.error(f"Failed to synthesize fallback speech: {e}")
+                            logging.error(f"Failed to synthesize speech: {e}")
+                else:
+                    # Fallback response if Agent-S is unavailable
+                    logging.warning("Agent-S unavailable, using fallback response")
+                    fallback_text = "I understand. Let me process that for you."
 
-                except Exception as e:
-                    logging.error(f"Error communicating with Agent-S: {e}")
+                    try:
+                        _speak_to_call(fallback_text)
+                    except Exception as e:
+                        logging.error(f"Failed to synthesize fallback speech: {e}")
 
-        except audio.FishAudioError as e:
-            logging.error(f"Failed to transcribe audio: {e}")
-            # Audio might be too short or corrupted, skip processing
-        except Exception as e:
-            logging.error(f"Unexpected error during transcription: {e}")
+            except Exception as e:
+                logging.error(f"Error communicating with Agent-S: {e}")
 
+    except audio.FishAudioError as e:
+        logging.error(f"Failed to transcribe audio: {e}")
+        # Audio might be too short or corrupted, skip processing
     except Exception as e:
-        logging.error(f"Error handling utterance end: {e}", exc_info=True)
+        logging.error(f"Unexpected error during transcription: {e}")
 
 
 @sio.on("utterance_cancelled")
@@ -304,7 +422,7 @@ def on_utterance_cancelled(data):
     reason = data.get("reason", "unknown")
     duration = data.get("duration", 0)
     logging.info(
-        f"❌ UTTERANCE CANCELLED - Reason: {reason}, Duration: {duration:.2f}s"
+        "❌ UTTERANCE CANCELLED - Reason: %s, Duration: %.2fs", reason, duration
     )
     current_utterance_chunks = []
     utterance_start_time = None
@@ -331,30 +449,97 @@ def on_error(data):
     logging.error(f"Error from call service: {data}")
 
 
+def _build_shared_session() -> requests.Session:
+    session = requests.Session()
+    # Only failed connects are retried: the request never reached the
+    # upstream, so replaying a POST is safe. Read errors surface at once.
+    retry = Retry(total=2, connect=2, read=0, status=0, backoff_factor=0.1)
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=64, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+_SHARED_SESSION = _build_shared_session()
+
+
 @dataclass
 class RemoteClient:
     """HTTP helper wrapping requests with shared configuration."""
 
     base_url: str
-    timeout: float
+    # (connect, read): a dead upstream fails fast while slow replies still
+    # get the full read budget
+    timeout: Tuple[float, float] = (1.0, 10.0)
+    # Keep-alive pool shared by every client; urllib3 keys it per host
+    session: requests.Session = field(
+        default_factory=lambda: _SHARED_SESSION, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        self._base = self.base_url.rstrip("/")
+        # Routes here use a handful of fixed paths; build each URL once
+        self._urls: Dict[str, str] = {}
 
     def _full_url(self, path: str) -> str:
-        if not path.startswith("/"):
-            raise ValueError("path must start with '/'")
-        return f"{self.base_url.rstrip('/')}{path}"
+        url = self._urls.get(path)
+        if url is None:
+            if not path.startswith("/"):
+                raise ValueError("path must start with '/'")
+            url = self._urls[path] = self._base + path
+        return url
+
+    # stream=True leaves the body unread; the caller must consume or close the
+    # response (_forward_response does) so the connection returns to the pool.
+    def post_json(
+        self, path: str, payload: Dict[str, Any], *, stream: bool = False
+    ) -> requests.Response:
+        url = self._full_url(path)
+        logging.debug("POST %s", url)
+        return self.session.post(
+            url,
+            timeout=self.timeout,
+            data=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+            stream=stream,
+        )
 
-    def post_json(self, path: str, payload: Dict[str, Any]) -> requests.Response:
+    def post_raw(
+        self, path: str, data: bytes, content_type: str, *, stream: bool = False
+    ) -> requests.Response:
         url = self._full_url(path)
         logging.debug("POST %s", url)
-        return requests.post(url, timeout=self.timeout, json=payload)
+        return self.session.post(
+            url,
+            timeout=self.timeout,
+            data=data,
+            headers={"Content-Type": content_type},
+            stream=stream,
+        )
+
+    def post_multipart(
+        self,
+        path: str,
+        data: Dict[str, Any],
+        files: Iterable[Tuple[str, Any]],
+        *,
+        stream: bool = False,
+    ) -> requests.Response:
+        url = self._full_url(path)
+        logging.debug("POST %s (multipart)", url)
+        return self.session.post(
+            url, timeout=self.timeout, data=data, files=files, stream=stream
+        )
 
-    def get(self, path: str) -> requests.Response:
+    def get(self, path: str, *, stream: bool = False) -> requests.Response:
         url = self._full_url(path)
         logging.debug("GET %s", url)
-        return requests.get(url, timeout=self.timeout)
+        return self.session.get(url, timeout=self.timeout, stream=stream)
 
 
 HTTP_TIMEOUT = float(os.getenv("BACKEND_HTTP_TIMEOUT", "60"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("BACKEND_HTTP_CONNECT_TIMEOUT", "1.0"))
+HTTP_TIMEOUTS = (HTTP_CONNECT_TIMEOUT, HTTP_TIMEOUT)
 AGENT_HOST = os.environ["AGENT_HOST"]
 AGENT_PORT = os.environ["AGENT_PORT"]
 UI_HOST = os.environ["UI_HOST"]
@@ -376,80 +561,206 @@ IMESSAGE_BRIDGE_BASE_URL = os.getenv(
     f"http://{IMESSAGE_BRIDGE_HOST}:{IMESSAGE_BRIDGE_PORT}",
 )
 
-agent_s_client = RemoteClient(base_url=AGENT_S_BASE_URL, timeout=HTTP_TIMEOUT)
-ui_client = RemoteClient(base_url=UI_SERVER_BASE_URL, timeout=HTTP_TIMEOUT)
+agent_s_client = RemoteClient(base_url=AGENT_S_BASE_URL, timeout=HTTP_TIMEOUTS)
+ui_client = RemoteClient(base_url=UI_SERVER_BASE_URL, timeout=HTTP_TIMEOUTS)
 imessage_bridge_client = RemoteClient(
-    base_url=IMESSAGE_BRIDGE_BASE_URL, timeout=HTTP_TIMEOUT
+    base_url=IMESSAGE_BRIDGE_BASE_URL, timeout=HTTP_TIMEOUTS
 )
+# A bridge on this machine reads attachments straight from our scratch dir;
+# anywhere else it can't see that path, so screenshots are uploaded instead.
+IMESSAGE_BRIDGE_IS_LOCAL = urlsplit(IMESSAGE_BRIDGE_BASE_URL).hostname in {
+    "localhost",
+    "127.0.0.1",
+    "::1",
+}
 
 
 class ScreenshotError(RuntimeError):
     pass
 
 
-_last_requester_phone: Optional[str] = None
+class RequesterRegistry:
+    """Phone numbers of recent iMessage requesters, keyed by conversation.
+
+    Bounded and safe to share across request threads; the most recently
+    active conversation is kept last.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_entries = max_entries
+
+    def record(self, conversation: str, phone: str) -> None:
+        with self._lock:
+            self._entries[conversation] = phone
+            self._entries.move_to_end(conversation)
+            if len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def lookup(self, conversation: Optional[str] = None) -> Optional[str]:
+        """Return the requester for a conversation, or the latest one."""
+        with self._lock:
+            if conversation:
+                return self._entries.get(conversation)
+            if not self._entries:
+                return None
+            return next(reversed(self._entries.values()))
+
+
+_requesters = RequesterRegistry()
+
 
+# Resolved once: subprocess only takes its posix_spawn fast path (instead of
+# fork+exec) for an executable given with a directory and close_fds=False.
+# Our own fds are non-inheritable by default, so nothing leaks to the child.
+SCREENCAPTURE = shutil.which("screencapture") or "screencapture"
+# Screenshot files are named by pid plus a counter: unique within this
+# process without an os.urandom call per capture. The bridge renames an
+# attachment that would clash with an older one in ~/Pictures.
+SCRATCH_DIR = Path(tempfile.gettempdir())
+_SCREENSHOT_SEQ = itertools.count()
 
-def capture_screenshot() -> str:
-    """Capture the primary display and return it base64 encoded."""
 
-    temp_dir = Path(tempfile.gettempdir())
-    temp_path = temp_dir / f"agent_s_{uuid4().hex}.png"
+def _quartz_capture_to_path(dest: Path) -> bool:
+    """Write the main display to dest as a PNG without spawning a process."""
+    image = Quartz.CGDisplayCreateImage(Quartz.CGMainDisplayID())
+    if image is None:  # e.g. Screen Recording permission not granted
+        return False
+    writer = Quartz.CGImageDestinationCreateWithURL(
+        NSURL.fileURLWithPath_(str(dest)), "public.png", 1, None
+    )
+    if writer is None:
+        return False
+    Quartz.CGImageDestinationAddImage(writer, image, None)
+    return bool(Quartz.CGImageDestinationFinalize(writer))
+
+
+def capture_screenshot_to_path(dest: Path) -> Path:
+    """Capture the primary display as a PNG written to dest.
+
+    Uses Quartz in-process when pyobjc is installed, falling back to the
+    screencapture tool.
+    """
+    if Quartz is not None:
+        try:
+            if _quartz_capture_to_path(dest):
+                return dest
+        except Exception:  # pragma: no cover - defensive: pyobjc specifics
+            logging.debug("Quartz capture failed; using screencapture", exc_info=True)
     try:
-        subprocess.run(["screencapture", "-x", str(temp_path)], check=True)
-        encoded = base64.b64encode(temp_path.read_bytes()).decode("ascii")
-        return encoded
+        subprocess.run([SCREENCAPTURE, "-x", str(dest)], check=True, close_fds=False)
     except (subprocess.CalledProcessError, FileNotFoundError) as exc:
         raise ScreenshotError("Failed to capture screenshot") from exc
-    finally:
-        try:
-            temp_path.unlink(missing_ok=True)
-        except OSError:
-            logging.warning("Could not delete temporary screenshot %s", temp_path)
+    return dest
+
+
+FORWARD_CHUNK_SIZE = 64 * 1024
 
 
 def _forward_response(remote_response: Optional[requests.Response]):
     if remote_response is None:
         return jsonify({"status": "forward_failed"}), 502
 
-    content_type = (remote_response.headers.get("Content-Type") or "").lower()
-    if "application/json" in content_type:
-        try:
-            body = remote_response.json()
-        except ValueError:
-            logging.warning(
-                "Expected JSON but got invalid payload from %s", remote_response.url
-            )
-            body = {"raw": remote_response.text}
-        return jsonify(body), remote_response.status_code
-
-    return (
-        remote_response.text,
-        remote_response.status_code,
-        {
-            "Content-Type": content_type or "text/plain",
-        },
+    # Bodies, JSON included, are relayed chunk by chunk without being parsed
+    # and re-serialized here
+    relayed = Response(
+        remote_response.iter_content(FORWARD_CHUNK_SIZE),
+        status=remote_response.status_code,
+        content_type=remote_response.headers.get("Content-Type") or "text/plain",
     )
+    relayed.call_on_close(remote_response.close)
+    return relayed
+
+
+def _log_payload(label: str, payload: Dict[str, Any]) -> None:
+    """Log a request payload's keys at INFO; the full body only at DEBUG."""
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("%s: %s", label, payload)
+    else:
+        logging.info("%s keys=%s", label, list(payload))
 
 
 def _safe_post(
-    client: RemoteClient, path: str, payload: Dict[str, Any]
+    client: RemoteClient, path: str, payload: Dict[str, Any], *, stream: bool = False
 ) -> Optional[requests.Response]:
     try:
-        return client.post_json(path, payload)
+        return client.post_json(path, payload, stream=stream)
     except requests.RequestException as exc:
         logging.error("POST %s failed: %s", path, exc, exc_info=True)
         return None
 
 
-def _safe_get(client: RemoteClient, path: str) -> Optional[requests.Response]:
+def _safe_post_raw(
+    client: RemoteClient,
+    path: str,
+    data: bytes,
+    content_type: str = "application/json",
+    *,
+    stream: bool = False,
+) -> Optional[requests.Response]:
     try:
-        return client.get(path)
+        return client.post_raw(path, data, content_type, stream=stream)
+    except requests.RequestException as exc:
+        logging.error("POST %s failed: %s", path, exc, exc_info=True)
+        return None
+
+
+def _safe_post_file(
+    client: RemoteClient,
+    path: str,
+    data: Dict[str, Any],
+    field_name: str,
+    file_path: Path,
+    *,
+    stream: bool = False,
+) -> Optional[requests.Response]:
+    try:
+        with file_path.open("rb") as handle:
+            return client.post_multipart(
+                path,
+                data,
+                [(field_name, (file_path.name, handle, "image/png"))],
+                stream=stream,
+            )
+    except (OSError, requests.RequestException) as exc:
+        logging.error("POST %s failed: %s", path, exc, exc_info=True)
+        return None
+
+
+def _safe_get(
+    client: RemoteClient, path: str, *, stream: bool = False
+) -> Optional[requests.Response]:
+    try:
+        return client.get(path, stream=stream)
     except requests.RequestException as exc:
         logging.error("GET %s failed: %s", path, exc, exc_info=True)
         return None
 
 
+# Bound once; formats reaching the lookup are already normalized lowercase
+_FORMAT_CONTENT_TYPES = audio.AUDIO_FORMAT_CONTENT_TYPES
+_DEFAULT_CONTENT_TYPE = audio.DEFAULT_AUDIO_CONTENT_TYPE
+
+
+def _content_type_for(normalized_format: Optional[str]) -> str:
+    return _FORMAT_CONTENT_TYPES.get(normalized_format, _DEFAULT_CONTENT_TYPE)
+
+
+def _normalize_speech_options(
+    voice: Optional[str], audio_format: Optional[str]
+) -> Tuple[Optional[str], Optional[str]]:
+    normalized_voice = (
+        voice.strip() if isinstance(voice, str) and voice.strip() else None
+    )
+    # Normalized once here; the same lowercase key feeds the SDK and the
+    # content-type table
+    normalized_format = (
+        audio_format.strip().lower() or None if isinstance(audio_format, str) else None
+    )
+    return normalized_voice, normalized_format
+
+
 def _synthesize_speech_payload(
     text: str,
     *,
@@ -457,14 +768,7 @@ def _synthesize_speech_payload(
     audio_format: Optional[str] = None,
 ) -> Tuple[bytes, str]:
     """Synthesize speech and return audio bytes with best-effort content type."""
-    normalized_voice = (
-        voice.strip() if isinstance(voice, str) and voice.strip() else None
-    )
-    normalized_format = (
-        audio_format.strip()
-        if isinstance(audio_format, str) and audio_format.strip()
-        else None
-    )
+    normalized_voice, normalized_format = _normalize_speech_options(voice, audio_format)
 
     audio_bytes = audio.synthesize_speech_from_text(
         str(text),
@@ -472,11 +776,15 @@ def _synthesize_speech_payload(
         audio_format=normalized_format,
     )
 
-    content_type_key = normalized_format.lower() if normalized_format else ""
-    content_type = audio.AUDIO_FORMAT_CONTENT_TYPES.get(
-        content_type_key, audio.DEFAULT_AUDIO_CONTENT_TYPE
-    )
-    return audio_bytes, content_type
+    return audio_bytes, _content_type_for(normalized_format)
+
+
+# Resolved once at import like the rest of the configuration
+VOICE_OUTPUT_DEVICE = (
+    os.getenv("VOICE_SUMMARY_OUTPUT_DEVICE")
+    or os.getenv("CURRENT_ACTION_AUDIO_DEVICE")
+    or os.getenv("AUDIO_OUTPUT_DEVICE")
+)
 
 
 def _play_audio_bytes(
@@ -509,12 +817,7 @@ def _play_audio_bytes(
         except Exception as exc:
             logging.debug("Failed to stop previous audio: %s", exc)
 
-    device_name = (
-        output_device
-        or os.getenv("VOICE_SUMMARY_OUTPUT_DEVICE")
-        or os.getenv("CURRENT_ACTION_AUDIO_DEVICE")
-        or os.getenv("AUDIO_OUTPUT_DEVICE")
-    )
+    device_name = output_device or VOICE_OUTPUT_DEVICE
 
     device_index: Optional[int] = None
     if device_name:
@@ -578,22 +881,69 @@ def _play_audio_bytes(
         logging.error("Audio playback failed: %s", exc)
 
 
+# Single worker so queued voice notifications never talk over each other.
+_voice_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="voice")
+# Fire-and-forget connection warm-ups that overlap slow local work.
+_warmup_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="warmup")
+
+
+# Pending /api/currentaction updates for the UI, oldest dropped when full
+# Holds request bodies as received; the UI gets the same bytes Agent-S sent
+_ui_updates: queue.Queue = queue.Queue(maxsize=1024)
+
+
+def _queue_ui_update(body: bytes) -> None:
+    while True:
+        try:
+            _ui_updates.put_nowait(body)
+            return
+        except queue.Full:
+            try:
+                _ui_updates.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def _send_ui_updates() -> None:
+    """Forward queued current-action updates to the UI in order."""
+    while True:
+        body = _ui_updates.get()
+        response = _safe_post_raw(ui_client, "/api/currentaction", body)
+        if response is not None:
+            response.close()
+
+
+threading.Thread(target=_send_ui_updates, name="ui-updates", daemon=True).start()
+
+
+def _speak_notification(
+    text: str, *, voice: Optional[str], audio_format: Optional[str]
+) -> None:
+    """Synthesize and play a voice notification, logging synthesis failures."""
+    try:
+        audio_bytes, _ = _synthesize_speech_payload(
+            text, voice=voice, audio_format=audio_format
+        )
+    except (audio.FishAudioError, ValueError) as exc:
+        logging.error("Failed to synthesize voice notification: %s", exc)
+        return
+    _play_audio_bytes(audio_bytes, audio_format=audio_format)
+
+
 @app.route("/api/completetask", methods=["POST"])
 def complete_task():
     payload = request.get_json(silent=True) or {}
-    logging.info("Received complete task payload: %s", payload)
+    _log_payload("Received complete task payload", payload)
 
-    phone_number = _last_requester_phone
+    # Agent-S echoes the conversation key it was started with; callers that
+    # omit it get whoever messaged last
+    conversation = payload.get("conversation")
+    phone_number = _requesters.lookup(
+        conversation if isinstance(conversation, str) else None
+    )
     if not phone_number:
         logging.warning("No phone number available for task completion notification")
         return jsonify({"error": "phone_number unavailable"}), 400
-    phone_number = phone_number.strip()
-
-    try:
-        screenshot_b64 = capture_screenshot()
-    except ScreenshotError as exc:
-        logging.exception("Screenshot capture failed")
-        return jsonify({"error": str(exc)}), 500
 
     action_text = payload.get("action")
     if action_text is not None and not isinstance(action_text, str):
@@ -607,39 +957,78 @@ def complete_task():
         message_parts.append(action_text.strip())
     message_text = "\n".join(message_parts) if message_parts else "Task update"
 
-    temp_dir = Path(tempfile.gettempdir())
-    attachment_path = temp_dir / f"agent_s_task_{uuid4().hex}.png"
-    try:
-        attachment_path.write_bytes(base64.b64decode(screenshot_b64))
-    except (ValueError, OSError) as exc:
-        return jsonify({"error": f"Unable to prepare screenshot: {exc}"}), 500
+    # Callers that only need the text (e.g. status pings) can skip the capture
+    attachment_path: Optional[Path] = None
+    if payload.get("include_screenshot", True):
+        attachment_path = (
+            SCRATCH_DIR / f"agent_s_task_{os.getpid()}_{next(_SCREENSHOT_SEQ)}.png"
+        )
+        # Warm a pooled connection to the bridge while screencapture runs, so
+        # the forward below doesn't pay connection setup after the capture.
+        _warmup_executor.submit(_safe_get, imessage_bridge_client, "/health")
 
     try:
-        forward_payload = {
-            "target": phone_number,
-            "text": message_text,
-            "attachments": [str(attachment_path)],
-        }
-        response = _safe_post(
-            imessage_bridge_client, "/api/send_imessage", forward_payload
-        )
+        if attachment_path is not None:
+            # screencapture writes the attachment itself; the PNG never passes
+            # through this process
+            try:
+                capture_screenshot_to_path(attachment_path)
+            except ScreenshotError as exc:
+                logging.exception("Screenshot capture failed")
+                return jsonify({"error": str(exc)}), 500
+
+        if attachment_path is not None and not IMESSAGE_BRIDGE_IS_LOCAL:
+            response = _safe_post_file(
+                imessage_bridge_client,
+                "/api/send_imessage",
+                {"target": phone_number, "text": message_text},
+                "attachment",
+                attachment_path,
+                stream=True,
+            )
+        else:
+            forward_payload = {
+                "target": phone_number,
+                "text": message_text,
+                "attachments": [str(attachment_path)] if attachment_path else [],
+            }
+            response = _safe_post(
+                imessage_bridge_client,
+                "/api/send_imessage",
+                forward_payload,
+                stream=True,
+            )
         if response is None:
             return jsonify({"status": "failed", "bridge_forwarded": False}), 502
         return _forward_response(response)
     finally:
-        try:
-            attachment_path.unlink(missing_ok=True)
-        except OSError:
-            logging.warning("Could not delete temporary attachment %s", attachment_path)
+        if attachment_path is not None:
+            try:
+                attachment_path.unlink(missing_ok=True)
+            except OSError:
+                logging.warning(
+                    "Could not delete temporary attachment %s", attachment_path
+                )
 
 
 @app.route("/api/currentaction", methods=["POST"])
 def current_action():
-    payload = request.get_json(silent=True) or {}
+    # Parsed only for the stop and voice_summary fields; the UI is sent the
+    # original bytes rather than a re-serialized copy
+    body = request.get_data(cache=False)
+    try:
+        payload = orjson.loads(body) if body else {}
+    except orjson.JSONDecodeError:
+        payload = {}
+    if not isinstance(payload, dict) or not payload:
+        payload, body = {}, b"{}"
     for _, v in payload.items():
         if isinstance(v, str) and v.strip().lower() == "stopping":
-            # Stop the agent
-            _proxy_command("/api/stop")
+            # Stop the agent; only the side effect matters, so release the
+            # pooled connection right away
+            stopped = _safe_get(agent_s_client, "/api/stop")
+            if stopped is not None:
+                stopped.close()
             break
 
     text = str(payload.get("voice_summary", "") or "").strip()
@@ -648,62 +1037,93 @@ def current_action():
     voice = "b545c585f631496c914815291da4e893"  # woman voice
     audio_format = "mp3"  # fish.audio TTSRequest default format
 
+    # Both hops are best-effort and run in the background: the summary is
+    # spoken on the voice worker and the UI update goes through the sender
+    # queue, so Agent-S never waits on TTS, playback or the UI.
     if text:
-        try:
-            audio_bytes, _ = _synthesize_speech_payload(
-                text, voice=voice, audio_format=audio_format
-            )
-            _play_audio_bytes(audio_bytes, audio_format=audio_format)
-        except (audio.FishAudioError, ValueError) as exc:
-            logging.error("Failed to synthesize voice notification: %s", exc)
-            return
+        _voice_executor.submit(
+            _speak_notification, text, voice=voice, audio_format=audio_format
+        )
 
-    logging.info("Current action update: %s", payload)
+    _log_payload("Current action update", payload)
 
-    response = _safe_post(ui_client, "/api/currentaction", payload)
-    if response is None:
-        return jsonify({"status": "queued", "ui_forwarded": False}), 202
-
-    return _forward_response(response)
+    _queue_ui_update(body)
+    return jsonify({"status": "queued"}), 202
 
 
 @app.route("/api/chat", methods=["POST"])
 def chat():
-    payload = request.get_json(silent=True) or {}
-    logging.info("UI chat payload: %s", payload)
-
-    response = _safe_post(agent_s_client, "/api/chat", payload)
+    # Pure pass-through: the body goes to Agent-S without a parse/serialize
+    # round trip
+    body = request.get_data(cache=False) or b"{}"
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("UI chat payload: %s", body)
+    else:
+        logging.info("UI chat payload bytes=%d", len(body))
+
+    response = _safe_post_raw(
+        agent_s_client,
+        "/api/chat",
+        body,
+        request.content_type or "application/json",
+        stream=True,
+    )
     if response is None:
         return jsonify({"status": "queued", "agent_forwarded": False}), 202
 
     return _forward_response(response)
 
 
+# Surrounding quotes left on pasted paths; interior quotes are kept
+ATTACHMENT_QUOTES = "\"'"
+
+
+@functools.lru_cache(maxsize=256)
+def _normalize_attachment(raw: str) -> str:
+    """Unquote and expand one attachment path; repeats hit the cache."""
+    return str(Path(raw.strip().strip(ATTACHMENT_QUOTES)).expanduser())
+
+
+class SendIMessageRequest(msgspec.Struct, frozen=True):
+    """Body of POST /api/send_imessage."""
+
+    target: str
+    text: Optional[str] = None
+    attachments: Optional[list[str]] = None
+
+
+# Decodes and type-checks the body in one C pass, straight from the bytes
+_SEND_IMESSAGE_DECODER = msgspec.json.Decoder(SendIMessageRequest)
+
+
 @app.route("/api/send_imessage", methods=["POST"])
 def send_imessage_endpoint() -> Any:
-    payload = request.get_json(silent=True) or {}
-    target = payload.get("target")
-    text = payload.get("text")
-    attachments = payload.get("attachments")
+    try:
+        payload = _SEND_IMESSAGE_DECODER.decode(request.get_data(cache=False) or b"{}")
+    except msgspec.ValidationError as exc:
+        return jsonify({"error": str(exc)}), 400
+    except msgspec.DecodeError:
+        return jsonify({"error": "request body must be a JSON object"}), 400
+
+    target = payload.target
+    text = payload.text
+    attachments = payload.attachments
     logging.info("Send iMessage request for target=%s", target)
 
-    if not isinstance(target, str) or not target.strip():
+    if not target.strip():
         return jsonify({"error": "target is required"}), 400
-    if text is not None and not isinstance(text, str):
-        return jsonify({"error": "text must be a string"}), 400
-    if attachments is not None and not isinstance(attachments, list):
-        return jsonify({"error": "attachments must be a list"}), 400
 
     file_list: Optional[list[str]] = None
     if attachments:
-        file_list = []
-        for item in attachments:
-            if not isinstance(item, str) or not item.strip():
-                return (
-                    jsonify({"error": "attachments must contain non-empty paths"}),
-                    400,
-                )
-            file_list.append(str(Path(item.strip().strip("\"'")).expanduser()))
+        # One pass; any dropped (blank) entry shows up as a length mismatch
+        file_list = [
+            _normalize_attachment(item) for item in attachments if item.strip()
+        ]
+        if len(file_list) != len(attachments):
+            return (
+                jsonify({"error": "attachments must contain non-empty paths"}),
+                400,
+            )
 
     if text is not None and not text.strip():
         text = None
@@ -715,51 +1135,97 @@ def send_imessage_endpoint() -> Any:
         "text": text,
         "attachments": file_list,
     }
-    response = _safe_post(imessage_bridge_client, "/api/send_imessage", forward_payload)
+    response = _safe_post(
+        imessage_bridge_client, "/api/send_imessage", forward_payload, stream=True
+    )
     if response is None:
         return jsonify({"status": "failed", "bridge_forwarded": False}), 502
 
     return _forward_response(response)
 
 
-@app.route("/api/new_imessage", methods=["POST"])
-def new_imessage() -> Any:
-    payload = request.get_json(silent=True) or {}
-    logging.info("New iMessage payload: %s", payload)
-
-    phone_number = payload.get("phone_number")
-    if isinstance(phone_number, str) and phone_number.strip():
-        global _last_requester_phone
-        _last_requester_phone = phone_number.strip()
-
-    message_text = payload.get("text")
+def _imessage_forward_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the Agent-S chat payload for one bridged iMessage."""
+    # Shallow C-level copy; everything except the text travels as metadata
+    metadata = dict(payload)
+    message_text = metadata.pop("text", None)
     if message_text is None:
         message_text = ""
     elif not isinstance(message_text, str):
         message_text = str(message_text)
 
-    if phone_number and isinstance(phone_number, str) and phone_number.strip():
+    phone_number = payload.get("phone_number")
+    phone = phone_number.strip() if isinstance(phone_number, str) else ""
+    requester_key: Optional[str] = None
+    if phone:
+        conversation = payload.get("conversation")
+        requester_key = (
+            conversation if isinstance(conversation, str) and conversation else phone
+        )
+        _requesters.record(requester_key, phone)
         prompt_body = message_text.strip()
         if prompt_body:
-            prompt = f"Message from {phone_number.strip()}:\n{prompt_body}"
+            prompt = f"Message from {phone}:\n{prompt_body}"
         else:
-            prompt = f"Message from {phone_number.strip()}."
+            prompt = f"Message from {phone}."
     else:
         prompt = message_text
 
+    forward_payload: Dict[str, Any] = {"prompt": prompt, "metadata": metadata}
+    if requester_key is not None:
+        # Agent-S echoes this back on /api/completetask so the reply goes to
+        # this requester even if someone else has messaged since
+        forward_payload["conversation"] = requester_key
+    return forward_payload
+
+
+@app.route("/api/new_imessage", methods=["POST"])
+def new_imessage() -> Any:
+    payload = request.get_json(silent=True) or {}
+    _log_payload("New iMessage payload", payload)
+
     # Forward to agent_s for LLM processing
-    forward_payload: Dict[str, Any] = {
-        "prompt": prompt,
-        "metadata": {k: v for k, v in payload.items() if k != "text"},
-    }
-    response = _safe_post(agent_s_client, "/api/chat", forward_payload)
+    forward_payload = _imessage_forward_payload(payload)
+    response = _safe_post(agent_s_client, "/api/chat", forward_payload, stream=True)
     if response is None:
         return jsonify({"status": "queued", "agent_forwarded": False}), 202
     return _forward_response(response)
 
 
+@app.route("/api/new_imessage_batch", methods=["POST"])
+def new_imessage_batch() -> Any:
+    """Accept every message from one bridge poll tick in a single request."""
+    body = request.get_json(silent=True) or {}
+    messages = body.get("messages")
+    if not isinstance(messages, list):
+        return jsonify({"error": "messages must be a list"}), 400
+    logging.info("New iMessage batch with %d message(s)", len(messages))
+
+    forwarded = 0
+    for payload in messages:
+        if not isinstance(payload, dict):
+            continue
+        response = _safe_post(
+            agent_s_client, "/api/chat", _imessage_forward_payload(payload)
+        )
+        if response is not None:
+            forwarded += 1
+
+    status_code = 200 if forwarded == len(messages) else 202
+    return (
+        jsonify(
+            {
+                "status": "forwarded" if status_code == 200 else "queued",
+                "received": len(messages),
+                "agent_forwarded": forwarded,
+            }
+        ),
+        status_code,
+    )
+
+
 def _proxy_command(path: str):
-    response = _safe_get(agent_s_client, path)
+    response = _safe_get(agent_s_client, path, stream=True)
     if response is None:
         return jsonify({"status": "failed", "agent_forwarded": False}), 502
 
@@ -784,9 +1250,17 @@ def resume():
     return _proxy_command("/api/resume")
 
 
+TRANSCRIBE_MAX_BYTES = int(
+    os.getenv("BACKEND_TRANSCRIBE_MAX_BYTES", str(50 * 1024 * 1024))
+)
+
+
 @app.route("/api/audio/transcribe", methods=["POST"])
 def transcribe() -> Response:
     """Transcribe raw audio bytes sent in the request body via fish.audio ASR."""
+    # Oversized uploads get a 413 before the body is buffered (checked against
+    # Content-Length up front, and while reading for chunked bodies)
+    request.max_content_length = TRANSCRIBE_MAX_BYTES
     audio_bytes = request.get_data(cache=False)
     if not audio_bytes:
         return (
@@ -798,7 +1272,11 @@ def transcribe() -> Response:
 
     try:
         transcript = audio.transcribe_audio_bytes(audio_bytes, language=language)
-        return jsonify({"text": transcript}), HTTPStatus.OK
+        return Response(
+            orjson.dumps({"text": transcript}),
+            status=HTTPStatus.OK,
+            mimetype="application/json",
+        )
     except audio.FishAudioError as exc:
         logging.error("fish.audio error: %s", exc)
         return jsonify({"error": str(exc)}), HTTPStatus.BAD_GATEWAY
@@ -809,8 +1287,12 @@ def transcribe() -> Response:
 @app.route("/api/audio/synthesize", methods=["POST"])
 def synthesize() -> Response:
     """Synthesize speech for the provided text via fish.audio TTS."""
-    payload = request.get_json(silent=True) or {}
-    text = payload.get("text")
+    body = request.get_data()
+    try:
+        payload = orjson.loads(body) if body else {}
+    except orjson.JSONDecodeError:
+        payload = {}
+    text = payload.get("text") if isinstance(payload, dict) else None
 
     if not text:
         return (
@@ -818,26 +1300,32 @@ def synthesize() -> Response:
             HTTPStatus.BAD_REQUEST,
         )
 
-    voice = payload.get("voice")
-    audio_format = payload.get("audio_format")
+    voice, audio_format = _normalize_speech_options(
+        payload.get("voice"), payload.get("audio_format")
+    )
+    content_type = _content_type_for(audio_format)
 
     try:
-        audio_bytes, content_type = _synthesize_speech_payload(
-            text, voice=voice, audio_format=audio_format
+        chunks = audio.stream_speech_from_text(
+            str(text), voice=voice, audio_format=audio_format
         )
-        return Response(io.BytesIO(audio_bytes).getvalue(), mimetype=content_type)
+        # Pull the first chunk now so SDK failures still map to an error status
+        first_chunk = next(chunks)
     except audio.FishAudioError as exc:
         logging.error("fish.audio error: %s", exc)
         return jsonify({"error": str(exc)}), HTTPStatus.BAD_GATEWAY
     except ValueError as exc:
         return jsonify({"error": str(exc)}), HTTPStatus.BAD_REQUEST
 
+    # Chunked transfer: audio reaches the client as fish.audio produces it
+    return Response(itertools.chain((first_chunk,), chunks), mimetype=content_type)
+
 
 @app.route("/api/call_started", methods=["POST"])
 def call_started() -> Response:
     """Handle notification from Agent-S that a FaceTime call has been initiated."""
     payload = request.get_json(silent=True) or {}
-    logging.info(f"Received call_started notification from Agent-S: {payload}")
+    _log_payload("Received call_started notification from Agent-S", payload)
 
     # Extract call metadata if provided
     number = payload.get("number")
@@ -884,7 +1372,7 @@ def call_started() -> Response:
 def call_ended() -> Response:
     """Handle notification that the FaceTime call has ended."""
     payload = request.get_json(silent=True) or {}
-    logging.info(f"Received call_ended notification: {payload}")
+    _log_payload("Received call_ended notification", payload)
 
     try:
         # End the call session
@@ -938,31 +1426,37 @@ def call_status() -> Response:
 
 @app.route("/api/send_audio_to_call", methods=["POST"])
 def send_audio_to_call() -> Response:
-    """Send audio to be played through the call output."""
-    # Get raw audio bytes from request body
-    audio_bytes = request.get_data(cache=False)
-
-    if not audio_bytes:
-        # Try to get from JSON payload with base64 encoding
-        payload = request.get_json(silent=True) or {}
-        audio_b64 = payload.get("audio")
-        if audio_b64:
-            try:
-                audio_bytes = base64.b64decode(audio_b64)
-            except Exception as e:
-                return (
-                    jsonify({"error": f"Invalid base64 audio data: {e}"}),
-                    HTTPStatus.BAD_REQUEST,
-                )
-        else:
-            return jsonify({"error": "No audio data provided"}), HTTPStatus.BAD_REQUEST
+    """Send audio to be played through the call output.
 
+    Preferred: the raw audio file as the request body
+    (``Content-Type: application/octet-stream``). A JSON body of the form
+    ``{"audio": "<base64>"}`` is still accepted.
+    """
+    # Checked first so a rejected request never reads or decodes its body
     if not call_manager.call_active:
         return (
             jsonify({"status": "error", "message": "No active call session"}),
             HTTPStatus.BAD_REQUEST,
         )
 
+    if request.is_json:
+        payload = request.get_json(silent=True) or {}
+        audio_b64 = payload.get("audio")
+        if not audio_b64:
+            return jsonify({"error": "No audio data provided"}), HTTPStatus.BAD_REQUEST
+        try:
+            audio_bytes = base64.b64decode(audio_b64)
+        except Exception as e:
+            return (
+                jsonify({"error": f"Invalid base64 audio data: {e}"}),
+                HTTPStatus.BAD_REQUEST,
+            )
+    else:
+        # Raw bytes go straight to the call with no decoding
+        audio_bytes = request.get_data(cache=False)
+        if not audio_bytes:
+            return jsonify({"error": "No audio data provided"}), HTTPStatus.BAD_REQUEST
+
     try:
         call_manager.send_audio_to_output(audio_bytes)
         return (
@@ -977,6 +1471,40 @@ def send_audio_to_call() -> Response:
         )
 
 
+def _warm_up() -> None:
+    """Open the upstream keep-alive connections and the call.py link early.
+
+    Services started alongside this one (run.sh) may not be listening yet, so
+    failures are logged quietly and the first real request connects as usual.
+    """
+    for client in (agent_s_client, ui_client, imessage_bridge_client):
+        try:
+            # Any status will do; reading the reply returns the socket to the pool
+            client.get("/health").close()
+        except requests.RequestException as exc:
+            logging.debug("Warm-up of %s skipped: %s", client.base_url, exc)
+
+    for delay in (1.0, 2.0, 4.0):
+        try:
+            call_manager.connect_to_call_service()
+            return
+        except Exception:
+            time.sleep(delay)
+    logging.info("Call service not reachable during warm-up; will connect on first call")
+
+
+if _env_bool("BACKEND_WARMUP", default=False):
+    _warmup_executor.submit(_warm_up)
+
+
 if __name__ == "__main__":
     debug = _env_bool("BACKEND_DEBUG", default=False)
-    app.run(host=SERVER_HOST, port=int(SERVER_PORT), debug=debug)
+    if USE_GEVENT:
+        from gevent.pywsgi import WSGIServer
+
+        logging.info("Serving with gevent WSGIServer on %s:%s", SERVER_HOST, SERVER_PORT)
+        WSGIServer((SERVER_HOST, int(SERVER_PORT)), app).serve_forever()
+    else:
+        # Development server; one thread per request. For production use
+        # BACKEND_GEVENT=true or `gunicorn -c gunicorn_conf.py main:app`.
+        app.run(host=SERVER_HOST, port=int(SERVER_PORT), debug=debug, threaded=True)